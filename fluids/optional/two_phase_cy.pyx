@@ -0,0 +1,233 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# distutils: extra_compile_args = -fopenmp
+# distutils: extra_link_args = -fopenmp
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Cython versions of the `Friedel`, `Chen_Friedel`, `Zhang_Webb` and `Theissing`
+correlations in `fluids.two_phase`, computed entirely with C doubles. They give the same
+results as the functions in `fluids.two_phase`. `Friedel_batch` evaluates
+the Friedel correlation over arrays of inputs in parallel using OpenMP
+threads; the number of threads can be set with the `OMP_NUM_THREADS`
+environment variable.
+
+Cython auto-compilation is not supported. To compile this file, run the
+following command in a shell after navigating to $FLUIDSPATH/fluids/optional/.
+This should generate the extension module two_phase_cy.so (or .pyd); a
+compiler supporting OpenMP is required:
+
+cythonize -i two_phase_cy.pyx
+
+If the module is not compiled, an import error will be raised on importing
+`fluids.optional.two_phase_cy`.
+'''
+
+from libc.math cimport exp, log, log1p, pow, sqrt, M_PI, NAN
+from cython.parallel cimport prange
+
+cdef double g = 9.80665
+cdef double LAMINAR_TRANSITION_PIPE = 2040.0
+
+
+cdef inline double friction_factor_c(double Re, double eD) nogil:
+    # Laminar solution or the `Clamond` solution to the Colebrook equation,
+    # as used by default in `fluids.friction.friction_factor`
+    cdef double X1, X2, F, X1F, X1F1, E, b
+    if Re < LAMINAR_TRANSITION_PIPE:
+        return 64.0/Re
+    X1 = eD*Re*0.1239681863354175460160858261654858382699
+    X2 = log(Re) - 0.7793974884556819406441139701653776731705
+    F = X2 - 0.2
+    X1F = X1 + F
+    X1F1 = 1. + X1F
+    E = (log(X1F) - 0.2)/(X1F1)
+    F = F - (X1F1 + 0.5*E)*E*(X1F)/(X1F1 + E*(1. + 1.0/3.0*E))
+    X1F = X1 + F
+    X1F1 = 1. + X1F
+    E = (log(X1F) + F - X2)/(X1F1)
+    b = (X1F1 + E*(1. + 1.0/3.0*E))
+    F = b/(b*F - ((X1F1 + 0.5*E)*E*(X1F)))
+    return 1.325474527619599502640416597148504422899*(F*F)
+
+
+cdef inline double single_phase_dp_c(double v, double rho, double mu,
+                                     double D, double eD, double LoD) nogil:
+    cdef double fd = friction_factor_c(rho*v*D/mu, eD)
+    return fd*LoD*(0.5*rho*v*v)
+
+
+cdef inline double friedel_phi_lo2_c(double x, double rhol, double rhog,
+                                     double mul, double mug, double sigma,
+                                     double D, double G_tp, double fd_lo,
+                                     double fd_go, double* We) nogil:
+    # Friedel's two-phase multiplier; also stores the homogeneous Weber
+    # number, which `Chen_Friedel_c` needs
+    cdef double F, H, E, rho_h, v_h, Fr
+    F = pow(x, 0.78)*pow(1.0 - x, 0.224)
+    H = pow(rhol/rhog, 0.91)*pow(mug/mul, 0.19)*pow(1.0 - mug/mul, 0.7)
+    E = (1.0 - x)*(1.0 - x) + x*x*(rhol*fd_go/(rhog*fd_lo))
+
+    rho_h = 1.0/(x/rhog + (1.0 - x)/rhol)
+    v_h = G_tp/rho_h
+    Fr = v_h*v_h/(g*D)
+    We[0] = rho_h*v_h*v_h*D/sigma
+    return E + 3.24*F*H/(pow(Fr, 0.0454)*pow(We[0], 0.035))
+
+
+cdef double Friedel_c(double m, double x, double rhol, double rhog,
+                      double mul, double mug, double sigma, double D,
+                      double roughness, double L) nogil:
+    cdef double G_tp, v_lo, v_go, eD, fd_lo, fd_go, dP_lo, We
+    G_tp = 4.0*m/(M_PI*D*D)
+    eD = roughness/D
+
+    v_lo = G_tp/rhol
+    fd_lo = friction_factor_c(rhol*v_lo*D/mul, eD)
+    dP_lo = fd_lo*L/D*(0.5*rhol*v_lo*v_lo)
+
+    v_go = G_tp/rhog
+    fd_go = friction_factor_c(rhog*v_go*D/mug, eD)
+    if x == 0.0:
+        return dP_lo
+    elif x == 1.0:
+        return fd_go*L/D*(0.5*rhog*v_go*v_go)
+    elif not 0.0 < x < 1.0:
+        return NAN # quality outside [0, 1]; cannot raise without the GIL
+    return friedel_phi_lo2_c(x, rhol, rhog, mul, mug, sigma, D, G_tp, fd_lo,
+                             fd_go, &We)*dP_lo
+
+
+cdef double Chen_Friedel_c(double m, double x, double rhol, double rhog,
+                           double mul, double mug, double sigma, double D,
+                           double roughness, double L) nogil:
+    cdef double G, eD, v_lo, Re_lo, Re_go, fd_lo, fd_go, dP_lo, phi_lo2
+    cdef double We, Bo, Omega
+    G = 4.0*m/(M_PI*D*D)
+    eD = roughness/D
+
+    v_lo = G/rhol
+    Re_lo = G*D/mul
+    fd_lo = friction_factor_c(Re_lo, eD)
+    dP_lo = 0.5*fd_lo*L/D*G*v_lo
+    Re_go = G*D/mug
+    fd_go = friction_factor_c(Re_go, eD)
+    phi_lo2 = friedel_phi_lo2_c(x, rhol, rhog, mul, mug, sigma, D, G, fd_lo,
+                                fd_go, &We)
+
+    Bo = 0.25*g*(rhol - rhog)*D*D/sigma # Custom definition
+    if Bo < 2.5:
+        Omega = 0.0333*pow(Re_lo, 0.45)/(pow(Re_go*x, 0.09)*(1.0 + 0.5*exp(-Bo)))
+    else:
+        Omega = pow(We, 0.2)/(2.5 + 0.06*Bo)
+    return phi_lo2*dP_lo*Omega
+
+
+cdef double Zhang_Webb_c(double m, double x, double rhol, double mul,
+                         double P, double Pc, double D, double roughness,
+                         double L) nogil:
+    cdef double G, v_lo, fd_lo, dP_lo, inv_Pr, phi_lo2
+    G = 4.0*m/(M_PI*D*D)
+    v_lo = G/rhol
+    fd_lo = friction_factor_c(G*D/mul, roughness/D)
+    dP_lo = 0.5*fd_lo*L/D*G*v_lo
+
+    inv_Pr = Pc/P
+    phi_lo2 = ((1.0 - x)*(1.0 - x) + 2.87*x*x*inv_Pr
+               + 1.68*pow(x, 0.8)*exp(0.25*log1p(-x))*pow(inv_Pr, 1.64))
+    return phi_lo2*dP_lo
+
+
+cdef double Theissing_c(double m, double x, double rhol, double rhog,
+                        double mul, double mug, double D, double roughness,
+                        double L) nogil:
+    cdef double G_tp, v_lo, v_go, v_l, v_g, eD, LoD, dP_lo, dP_go, dP_l, dP_g
+    cdef double n1, n2, n, epsilon, ratio
+    G_tp = 4.0*m/(M_PI*D*D)
+    eD = roughness/D
+    LoD = L/D
+
+    v_lo = G_tp/rhol
+    dP_lo = single_phase_dp_c(v_lo, rhol, mul, D, eD, LoD)
+    v_go = G_tp/rhog
+    dP_go = single_phase_dp_c(v_go, rhog, mug, D, eD, LoD)
+    if x == 0.0:
+        return dP_lo
+    elif x == 1.0:
+        return dP_go
+
+    v_l = v_lo*(1.0 - x)
+    dP_l = single_phase_dp_c(v_l, rhol, mul, D, eD, LoD)
+    v_g = v_go*x
+    dP_g = single_phase_dp_c(v_g, rhog, mug, D, eD, LoD)
+
+    n1 = log(dP_l/dP_lo)/log(1.0 - x)
+    n2 = log(dP_g/dP_go)/log(x)
+    ratio = pow(dP_g/dP_l, 0.1)
+    n = (n1 + n2*ratio)/(1.0 + ratio)
+    epsilon = 3.0 - 2.0*pow(2.0*sqrt(rhol/rhog)/(1.0 + rhol/rhog), 0.7/n)
+    return pow(pow(dP_lo, 1.0/(n*epsilon))*pow(1.0 - x, 1.0/epsilon)
+               + pow(dP_go, 1.0/(n*epsilon))*pow(x, 1.0/epsilon), n*epsilon)
+
+
+def Friedel(double m, double x, double rhol, double rhog, double mul,
+            double mug, double sigma, double D, double roughness=0.0,
+            double L=1.0):
+    '''Cython version of :obj:`fluids.two_phase.Friedel`.'''
+    return Friedel_c(m, x, rhol, rhog, mul, mug, sigma, D, roughness, L)
+
+
+def Chen_Friedel(double m, double x, double rhol, double rhog, double mul,
+                 double mug, double sigma, double D, double roughness=0.0,
+                 double L=1.0):
+    '''Cython version of :obj:`fluids.two_phase.Chen_Friedel`.'''
+    return Chen_Friedel_c(m, x, rhol, rhog, mul, mug, sigma, D, roughness, L)
+
+
+def Zhang_Webb(double m, double x, double rhol, double mul, double P,
+               double Pc, double D, double roughness=0.0, double L=1.0):
+    '''Cython version of :obj:`fluids.two_phase.Zhang_Webb`.'''
+    return Zhang_Webb_c(m, x, rhol, mul, P, Pc, D, roughness, L)
+
+
+def Theissing(double m, double x, double rhol, double rhog, double mul,
+              double mug, double D, double roughness=0.0, double L=1.0):
+    '''Cython version of :obj:`fluids.two_phase.Theissing`.'''
+    return Theissing_c(m, x, rhol, rhog, mul, mug, D, roughness, L)
+
+
+def Friedel_batch(double[::1] m, double[::1] x, double[::1] rhol,
+                  double[::1] rhog, double[::1] mul, double[::1] mug,
+                  double[::1] sigma, double[::1] D, double[::1] roughness,
+                  double[::1] L, double[::1] out):
+    '''Evaluates :obj:`fluids.two_phase.Friedel` for every element of the
+    input arrays, which must all be contiguous float64 arrays of the same
+    length as `out`, in which the results are stored. The elements are
+    calculated in parallel without the GIL.'''
+    cdef Py_ssize_t i, N = out.shape[0]
+    if not (m.shape[0] == x.shape[0] == rhol.shape[0] == rhog.shape[0]
+            == mul.shape[0] == mug.shape[0] == sigma.shape[0] == D.shape[0]
+            == roughness.shape[0] == L.shape[0] == N):
+        raise ValueError('All arrays must have the same length')
+    with nogil:
+        for i in prange(N, schedule='static'):
+            out[i] = Friedel_c(m[i], x[i], rhol[i], rhog[i], mul[i], mug[i],
+                               sigma[i], D[i], roughness[i], L[i])
+    return out
@@ -29,15 +29,34 @@ __all__ = ['two_phase_dP', 'two_phase_dP_acceleration',
            'Muller_Steinhagen_Heck', 'Gronnerud', 'Lombardi_Pedrocchi',
            'Jung_Radermacher', 'Tran', 'Chen_Friedel', 'Zhang_Webb', 'Xu_Fang',
            'Yu_France', 'Wang_Chiang_Lu', 'Hwang_Kim', 'Zhang_Hibiki_Mishima',
-           'Mishima_Hibiki', 'Bankoff', 'two_phase_correlations']
-
-from math import pi, log, exp, sin, cos, radians, log10
+           'Mishima_Hibiki', 'Bankoff', 'two_phase_correlations',
+           'Friedel_many', 'Chen_Friedel_many', 'Chisholm_many',
+           'Muller_Steinhagen_Heck_many', 'Tran_many', 'make_Friedel',
+           'make_Chen_Friedel', 'make_Zhang_Webb']
+
+from math import pi, log, log1p, exp, sin, cos, radians, log10, sqrt
+try:
+    from functools import lru_cache
+except ImportError: # pragma: no cover
+    # Python 2; results are simply not cached
+    def lru_cache(maxsize=128):
+        return lambda f: f
 from fluids.constants import g
-from fluids.numerics import splev, implementation_optimize_tck
-from fluids.friction import friction_factor
-from fluids.core import Reynolds, Froude, Weber, Confinement, Bond, Suratman
-from fluids.two_phase_voidage import homogeneous, Lockhart_Martinelli_Xtt
-
+from fluids.numerics import splev, implementation_optimize_tck, third
+try:
+    from math import cbrt
+except ImportError: # pragma: no cover
+    # Python < 3.11
+    def cbrt(x):
+        return x**third
+from fluids.numerics import numpy as np
+from fluids.friction import Clamond, LAMINAR_TRANSITION_PIPE
+from fluids.core import Reynolds, Froude, Suratman
+from fluids.two_phase_voidage import homogeneous
+
+# Pipe area is _QUARTER_PI*D*D; mass flux is _INV_QUARTER_PI*m/(D*D)
+_QUARTER_PI = 0.25*pi
+_INV_QUARTER_PI = 4.0/pi
 
 Beggs_Brill_dat = {'segregated': (0.98, 0.4846, 0.0868),
 'intermittent': (0.845, 0.5351, 0.0173),
@@ -98,7 +117,7 @@ def Beggs_Brill(m, x, rhol, rhog, mul, mug, sigma, P, D, angle, roughness=0.0,
     --------
     >>> Beggs_Brill(m=0.6, x=0.1, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6,
     ... sigma=0.0487, P=1E7, D=0.05, angle=0, roughness=0, L=1)
-    686.9724506803472
+    686.9724506803469
 
     References
     ----------
@@ -114,7 +133,7 @@ def Beggs_Brill(m, x, rhol, rhog, mul, mug, sigma, P, D, angle, roughness=0.0,
     qg = x*m/rhog
     ql = (1.0 - x)*m/rhol
     
-    A = 0.25*pi*D*D
+    A = _QUARTER_PI*D*D
     Vsg = qg/A
     Vsl = ql/A
     Vm = Vsg + Vsl
@@ -177,7 +196,7 @@ def Beggs_Brill(m, x, rhol, rhog, mul, mug, sigma, P, D, angle, roughness=0.0,
     mum = mul*lambda_L +  mug*(1.0 - lambda_L)
     rhom = rhol*lambda_L +  rhog*(1.0 - lambda_L)
     Rem = rhom*D/mum*Vm
-    fn = friction_factor(Re=Rem, eD=roughness/D)
+    fn = _ff(Rem, roughness/D)
     x = lambda_L/(Hl*Hl)
     
     
@@ -201,6 +220,53 @@ def Beggs_Brill(m, x, rhol, rhog, mul, mug, sigma, P, D, angle, roughness=0.0,
     return dP
 
 
+def _is_array(x):
+    # A quality which is not a number is calculated by the matching array
+    # implementation in `two_phase_correlations_array`
+    return not isinstance(x, (float, int)) and not np.isscalar(x)
+
+
+def _friction_factor(Re, eD):
+    # Same result as `friction_factor` with its default method, without its
+    # dispatch. `Clamond` is already explicit (no iteration) and agrees with
+    # Colebrook to machine precision, so faster approximations such as
+    # Tkachenko-Mileikovskyi would only change the results.
+    if Re < LAMINAR_TRANSITION_PIPE:
+        return 64./Re
+    return Clamond(Re, eD)
+
+# Every correlation needs at least two friction factors which depend only on
+# the flow rate, fluid properties and pipe - not on the quality - so sweeps
+# over `x` recompute the same values; cache them.
+_ff = lru_cache(maxsize=4096)(_friction_factor)
+
+
+@lru_cache(maxsize=1024)
+def _single_phase_props(m, D, rho, mu, roughness, L):
+    # Pressure drop, friction factor, Reynolds number and velocity of the
+    # whole flow as a single phase - the liquid-only or gas-only state. These
+    # do not depend on quality and are shared between correlations, so they
+    # are cached as a group. The friction factor is not looked up in the
+    # cache of `_ff` as well; when the state changes on every call, each
+    # cache miss costs more than the calculation it would save.
+    G = _INV_QUARTER_PI*m/(D*D)
+    D_inv = 1.0/D
+    # rho*v = G, so Re = G*D/mu and 0.5*rho*v**2 = 0.5*G*v
+    v = G/rho
+    Re = G*D/mu
+    fd = _friction_factor(Re, roughness*D_inv)
+    dP = 0.5*fd*L*D_inv*G*v
+    return dP, fd, Re, v
+
+
+def _lo_go_dp(m, rhol, rhog, mul, mug, D, roughness, L):
+    # Liquid-only and gas-only pressure drops, shared by most correlations
+    G_tp = _INV_QUARTER_PI*m/(D*D)
+    dP_lo, fd_lo, Re_lo, v_lo = _single_phase_props(m, D, rhol, mul, roughness, L)
+    dP_go, fd_go, Re_go, v_go = _single_phase_props(m, D, rhog, mug, roughness, L)
+    return dP_lo, dP_go, fd_lo, fd_go, Re_lo, Re_go, v_lo, v_go, G_tp
+
+
 def Friedel(m, x, rhol, rhog, mul, mug, sigma, D, roughness=0, L=1):
     r'''Calculates two-phase pressure drop with the Friedel correlation.
 
@@ -275,7 +341,7 @@ def Friedel(m, x, rhol, rhog, mul, mug, sigma, D, roughness=0, L=1):
 
     >>> Friedel(m=0.6, x=0.1, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6,
     ... sigma=0.0487, D=0.05, roughness=0, L=1)
-    738.6500525002245
+    738.6500525002247
 
     References
     ----------
@@ -296,32 +362,35 @@ def Friedel(m, x, rhol, rhog, mul, mug, sigma, D, roughness=0, L=1):
     .. [6] Ghiaasiaan, S. Mostafa. Two-Phase Flow, Boiling, and Condensation:
         In Conventional and Miniature Systems. Cambridge University Press, 2007.
     '''
-    # Liquid-only properties, for calculation of E, dP_lo
-    v_lo = m/rhol/(pi/4*D**2)
-    Re_lo = Reynolds(V=v_lo, rho=rhol, mu=mul, D=D)
-    fd_lo = friction_factor(Re=Re_lo, eD=roughness/D)
-    dP_lo = fd_lo*L/D*(0.5*rhol*v_lo**2)
-
-    # Gas-only properties, for calculation of E
-    v_go = m/rhog/(pi/4*D**2)
-    Re_go = Reynolds(V=v_go, rho=rhog, mu=mug, D=D)
-    fd_go = friction_factor(Re=Re_go, eD=roughness/D)
+    if _is_array(x):
+        return _Friedel_array(m, x, rhol, rhog, mul, mug, sigma, D, roughness,
+                              L)
+    # Liquid-only properties for dP_lo, gas-only friction factor for E
+    (dP_lo, dP_go, fd_lo, fd_go, _, _, _, _,
+     G_tp) = _lo_go_dp(m, rhol, rhog, mul, mug, D, roughness, L)
+    if x == 0.0:
+        return dP_lo
+    elif x == 1.0:
+        return dP_go
+    elif not 0.0 < x < 1.0:
+        raise ValueError('Quality `x` must be between 0 and 1')
 
-    F = x**0.78*(1-x)**0.224
-    H = (rhol/rhog)**0.91*(mug/mul)**0.19*(1 - mug/mul)**0.7
-    E = (1-x)**2 + x**2*(rhol*fd_go/(rhog*fd_lo))
+    # Powers are evaluated as exp of a sum of logarithms, F = x**0.78*(1-x)**0.224
+    # and H = (rhol/rhog)**0.91*(mug/mul)**0.19*(1 - mug/mul)**0.7
+    F = exp(0.78*log(x) + 0.224*log1p(-x))
+    mu_ratio = mug/mul
+    H = exp(0.91*log(rhol/rhog) + 0.19*log(mu_ratio) + 0.7*log1p(-mu_ratio))
+    E = (1-x)*(1-x) + x*x*(rhol*fd_go/(rhog*fd_lo))
 
     # Homogeneous properties, for Froude/Weber numbers
-    voidage_h = homogeneous(x, rhol, rhog)
-    rho_h = rhol*(1-voidage_h) + rhog*voidage_h
-    Q_h = m/rho_h
-    v_h = Q_h/(pi/4*D**2)
+    inv_rho_h = x/rhog + (1-x)/rhol
+    v_h = G_tp*inv_rho_h
 
-    Fr = Froude(V=v_h, L=D, squared=True) # checked with (m/(pi/4*D**2))**2/g/D/rho_h**2
-    We = Weber(V=v_h, L=D, rho=rho_h, sigma=sigma) # checked with (m/(pi/4*D**2))**2*D/sigma/rho_h
+    Fr = v_h*v_h/(g*D) # Froude(V=v_h, L=D, squared=True)
+    We = G_tp*v_h*D/sigma # Weber(V=v_h, L=D, rho=rho_h, sigma=sigma)
 
-    phi_lo2 = E + 3.24*F*H/(Fr**0.0454*We**0.035)
-    return phi_lo2*dP_lo
+    # phi_lo2*dP_lo; 1/(Fr**0.0454*We**0.035)
+    return (E + 3.24*F*H*exp(-0.0454*log(Fr) - 0.035*log(We)))*dP_lo
 
 
 def Gronnerud(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
@@ -382,7 +451,7 @@ def Gronnerud(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
     --------
     >>> Gronnerud(m=0.6, x=0.1, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6,
     ... D=0.05, roughness=0, L=1)
-    384.1254114447411
+    384.12541144474085
 
     References
     ----------
@@ -398,24 +467,87 @@ def Gronnerud(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
     .. [4] Thome, John R. "Engineering Data Book III." Wolverine Tube Inc
        (2004). http://www.wlv.com/heat-transfer-databook/
     '''
-    G = m/(pi/4*D**2)
-    V = G/rhol
-    Frl = Froude(V=V, L=D, squared=True)
+    if _is_array(x):
+        return _Gronnerud_array(m, x, rhol, rhog, mul, mug, D, roughness, L)
+    G = _INV_QUARTER_PI*m/(D*D)
+    # Liquid-only velocity, used for both Frl and dP_lo
+    v_lo = G/rhol
+    Frl = Froude(V=v_lo, L=D, squared=True)
     if Frl >= 1:
         f_Fr = 1
     else:
-        f_Fr = Frl**0.3 + 0.0055*(log(1./Frl))**2
-    dP_dL_Fr = f_Fr*(x + 4*(x**1.8 - x**10*f_Fr**0.5))
+        ln_Frl = log(Frl) # log(1/Frl)**2 == log(Frl)**2
+        f_Fr = exp(0.3*ln_Frl) + 0.0055*ln_Frl*ln_Frl
+    if x > 0.0:
+        ln_x = log(x)
+        x18, x10 = exp(1.8*ln_x), exp(10.0*ln_x)
+    else:
+        x18 = x10 = 0.0
+    dP_dL_Fr = f_Fr*(x + 4*(x18 - x10*sqrt(f_Fr)))
     phi_gd = 1 + dP_dL_Fr*((rhol/rhog)/(mul/mug)**0.25 - 1)
 
-    # Liquid-only properties, for calculation of E, dP_lo
-    v_lo = m/rhol/(pi/4*D**2)
+    # Liquid-only properties, for calculation of dP_lo
     Re_lo = Reynolds(V=v_lo, rho=rhol, mu=mul, D=D)
-    fd_lo = friction_factor(Re=Re_lo, eD=roughness/D)
-    dP_lo = fd_lo*L/D*(0.5*rhol*v_lo**2)
+    fd_lo = _ff(Re_lo, roughness/D)
+    dP_lo = fd_lo*L/D*(0.5*rhol*v_lo*v_lo)
     return phi_gd*dP_lo
 
 
+def _compute_B(mode, Gamma, G_tp):
+    # Chisholm's `B` coefficient; 'chisholm73' is the full schedule of
+    # Chisholm (1973), 'baroczy' the simpler one used with Baroczy's model
+    if mode == 'chisholm73':
+        if Gamma <= 9.5:
+            if G_tp <= 500:
+                return 4.8
+            elif G_tp < 1900:
+                return 2400./G_tp
+            return 55./sqrt(G_tp)
+        elif Gamma <= 28:
+            if G_tp <= 600:
+                return 520./(sqrt(G_tp)*Gamma)
+            return 21./Gamma
+        return 15000./(sqrt(G_tp)*Gamma*Gamma)
+    elif mode == 'baroczy':
+        if Gamma <= 9.5:
+            return 55./sqrt(G_tp)
+        elif Gamma <= 28:
+            return 520./(sqrt(G_tp)*Gamma)
+        return 15000./(sqrt(G_tp)*Gamma*Gamma)
+    raise Exception('Invalid mode for Chisholm B coefficient calculation')
+
+
+def _chisholm_core(m, x, rhol, rhog, mul, mug, D, roughness, L, mode,
+                   rough_correction=False):
+    # Shared body of `Chisholm` and `Baroczy_Chisholm`, which differ only in
+    # how `B` is computed
+    n = 0.25 # Blasius friction factor exponent
+    (dP_lo, dP_go, fd_lo, fd_go, Re_lo, Re_go, _, _,
+     G_tp) = _lo_go_dp(m, rhol, rhog, mul, mug, D, roughness, L)
+    if x == 0.0:
+        return dP_lo
+    elif x == 1.0:
+        return dP_go
+    elif not 0.0 < x < 1.0:
+        raise ValueError('Quality `x` must be between 0 and 1')
+
+    Gamma2 = dP_go/dP_lo
+    Gamma = sqrt(Gamma2)
+    B = _compute_B(mode, Gamma, G_tp)
+
+    if rough_correction:
+        n = log(fd_lo/fd_go)/log(Re_go/Re_lo)
+        mu_ratio = mug/mul
+        B_ratio = (0.5*(1 + mu_ratio*mu_ratio + 10**(-600*roughness/D)))**((0.25-n)/0.25)
+        B = B*B_ratio
+
+    # x**(2-n) is the square of x**((2-n)/2)
+    half_exp = (2.0 - n)*0.5
+    x_half = x**half_exp
+    phi2_ch = 1 + (Gamma2-1)*(B*x_half*(1-x)**half_exp + x_half*x_half)
+    return phi2_ch*dP_lo
+
+
 def Chisholm(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1,
              rough_correction=False):
     r'''Calculates two-phase pressure drop with the Chisholm (1973) correlation
@@ -506,7 +638,7 @@ def Chisholm(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1,
     --------
     >>> Chisholm(m=0.6, x=0.1, rhol=915., rhog=2.67, mul=180E-6,
     ... mug=14E-6, D=0.05, roughness=0, L=1)
-    1084.1489922923738
+    1084.148992292374
 
     References
     ----------
@@ -524,43 +656,11 @@ def Chisholm(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1,
        Engineering Science 20, no. 6 (December 1, 1978): 353-354.
        doi:10.1243/JMES_JOUR_1978_020_061_02.
     '''
-    G_tp = m/(pi/4*D**2)
-    n = 0.25 # Blasius friction factor exponent
-    # Liquid-only properties, for calculation of dP_lo
-    v_lo = m/rhol/(pi/4*D**2)
-    Re_lo = Reynolds(V=v_lo, rho=rhol, mu=mul, D=D)
-    fd_lo = friction_factor(Re=Re_lo, eD=roughness/D)
-    dP_lo = fd_lo*L/D*(0.5*rhol*v_lo**2)
-
-    # Gas-only properties, for calculation of dP_go
-    v_go = m/rhog/(pi/4*D**2)
-    Re_go = Reynolds(V=v_go, rho=rhog, mu=mug, D=D)
-    fd_go = friction_factor(Re=Re_go, eD=roughness/D)
-    dP_go = fd_go*L/D*(0.5*rhog*v_go**2)
-
-    Gamma = (dP_go/dP_lo)**0.5
-    if Gamma <= 9.5:
-        if G_tp <= 500:
-            B = 4.8
-        elif G_tp < 1900:
-            B = 2400./G_tp
-        else:
-            B = 55*G_tp**-0.5
-    elif Gamma <= 28:
-        if G_tp <= 600:
-            B = 520.*G_tp**-0.5/Gamma
-        else:
-            B = 21./Gamma
-    else:
-        B = 15000.*G_tp**-0.5/Gamma**2
-
-    if rough_correction:
-        n = log(fd_lo/fd_go)/log(Re_go/Re_lo)
-        B_ratio = (0.5*(1 + (mug/mul)**2 + 10**(-600*roughness/D)))**((0.25-n)/0.25)
-        B = B*B_ratio
-
-    phi2_ch = 1 + (Gamma**2-1)*(B*x**((2-n)/2.)*(1-x)**((2-n)/2.) + x**(2-n))
-    return phi2_ch*dP_lo
+    if _is_array(x):
+        return _Chisholm_array(m, x, rhol, rhog, mul, mug, D, roughness, L,
+                               rough_correction)
+    return _chisholm_core(m, x, rhol, rhog, mul, mug, D, roughness, L,
+                          'chisholm73', rough_correction)
 
 
 def Baroczy_Chisholm(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
@@ -629,7 +729,7 @@ def Baroczy_Chisholm(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
     --------
     >>> Baroczy_Chisholm(m=0.6, x=0.1, rhol=915., rhog=2.67, mul=180E-6,
     ... mug=14E-6, D=0.05, roughness=0, L=1)
-    1084.1489922923738
+    1084.148992292374
 
     References
     ----------
@@ -643,29 +743,11 @@ def Baroczy_Chisholm(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
        Correlations for Isothermal Two-Phase Horizontal Flow." Thesis, Oklahoma
        State University, 2013. https://shareok.org/handle/11244/11109.
     '''
-    G_tp = m/(pi/4*D**2)
-    n = 0.25 # Blasius friction factor exponent
-    # Liquid-only properties, for calculation of dP_lo
-    v_lo = m/rhol/(pi/4*D**2)
-    Re_lo = Reynolds(V=v_lo, rho=rhol, mu=mul, D=D)
-    fd_lo = friction_factor(Re=Re_lo, eD=roughness/D)
-    dP_lo = fd_lo*L/D*(0.5*rhol*v_lo**2)
-
-    # Gas-only properties, for calculation of dP_go
-    v_go = m/rhog/(pi/4*D**2)
-    Re_go = Reynolds(V=v_go, rho=rhog, mu=mug, D=D)
-    fd_go = friction_factor(Re=Re_go, eD=roughness/D)
-    dP_go = fd_go*L/D*(0.5*rhog*v_go**2)
-
-    Gamma = (dP_go/dP_lo)**0.5
-    if Gamma <= 9.5:
-        B = 55*G_tp**-0.5
-    elif Gamma <= 28:
-        B = 520.*G_tp**-0.5/Gamma
-    else:
-        B = 15000.*G_tp**-0.5/Gamma**2
-    phi2_ch = 1 + (Gamma**2-1)*(B*x**((2-n)/2.)*(1-x)**((2-n)/2.) + x**(2-n))
-    return phi2_ch*dP_lo
+    if _is_array(x):
+        return _Baroczy_Chisholm_array(m, x, rhol, rhog, mul, mug, D,
+                                       roughness, L)
+    return _chisholm_core(m, x, rhol, rhog, mul, mug, D, roughness, L,
+                          'baroczy')
 
 
 def Muller_Steinhagen_Heck(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
@@ -728,20 +810,13 @@ def Muller_Steinhagen_Heck(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
     .. [3] Thome, John R. "Engineering Data Book III." Wolverine Tube Inc
        (2004). http://www.wlv.com/heat-transfer-databook/
     '''
-    # Liquid-only properties, for calculation of dP_lo
-    v_lo = m/rhol/(pi/4*D**2)
-    Re_lo = Reynolds(V=v_lo, rho=rhol, mu=mul, D=D)
-    fd_lo = friction_factor(Re=Re_lo, eD=roughness/D)
-    dP_lo = fd_lo*L/D*(0.5*rhol*v_lo**2)
-
-    # Gas-only properties, for calculation of dP_go
-    v_go = m/rhog/(pi/4*D**2)
-    Re_go = Reynolds(V=v_go, rho=rhog, mu=mug, D=D)
-    fd_go = friction_factor(Re=Re_go, eD=roughness/D)
-    dP_go = fd_go*L/D*(0.5*rhog*v_go**2)
+    if _is_array(x):
+        return _Muller_Steinhagen_Heck_array(m, x, rhol, rhog, mul, mug, D,
+                                             roughness, L)
+    dP_lo, dP_go = _lo_go_dp(m, rhol, rhog, mul, mug, D, roughness, L)[:2]
 
     G_MSH = dP_lo + 2*(dP_go - dP_lo)*x
-    return G_MSH*(1-x)**(1/3.) + dP_go*x**3
+    return G_MSH*cbrt(1.0 - x) + dP_go*x*x*x
 
 
 def Lombardi_Pedrocchi(m, x, rhol, rhog, sigma, D, L=1):
@@ -784,7 +859,7 @@ def Lombardi_Pedrocchi(m, x, rhol, rhog, sigma, D, L=1):
     --------
     >>> Lombardi_Pedrocchi(m=0.6, x=0.1, rhol=915., rhog=2.67, sigma=0.045,
     ... D=0.05, L=1)
-    1567.328374498781
+    1567.3283744987866
 
     References
     ----------
@@ -798,9 +873,10 @@ def Lombardi_Pedrocchi(m, x, rhol, rhog, sigma, D, L=1):
        Macrotubes." Heat Transfer Engineering 37, no. 6 (April 12, 2016):
        487-506. doi:10.1080/01457632.2015.1060733.
     '''
-    voidage_h = homogeneous(x, rhol, rhog)
-    rho_h = rhol*(1-voidage_h) + rhog*voidage_h
-    G_tp = m/(pi/4*D**2)
+    if _is_array(x):
+        return _Lombardi_Pedrocchi_array(m, x, rhol, rhog, sigma, D, L)
+    rho_h = 1.0/(x/rhog + (1-x)/rhol) # homogeneous model density
+    G_tp = _INV_QUARTER_PI*m/(D*D)
     return 0.83*G_tp**1.4*sigma**0.4*L/(D**1.2*rho_h**0.866)
 
 
@@ -866,7 +942,7 @@ def Theissing(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
     --------
     >>> Theissing(m=0.6, x=.1, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6,
     ... D=0.05, roughness=0, L=1)
-    497.6156370699528
+    497.61563706995315
 
     References
     ----------
@@ -883,44 +959,48 @@ def Theissing(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
        Horizontal Tube. Comparison with Correlations." Heat and Mass Transfer
        42, no. 8 (April 6, 2006): 709-725. doi:10.1007/s00231-005-0020-7.
     '''
-    # Liquid-only flow
-    v_lo = m/rhol/(pi/4*D**2)
-    Re_lo = Reynolds(V=v_lo, rho=rhol, mu=mul, D=D)
-    fd_lo = friction_factor(Re=Re_lo, eD=roughness/D)
-    dP_lo = fd_lo*L/D*(0.5*rhol*v_lo**2)
-
-    # Gas-only flow
-    v_go = m/rhog/(pi/4*D**2)
-    Re_go = Reynolds(V=v_go, rho=rhog, mu=mug, D=D)
-    fd_go = friction_factor(Re=Re_go, eD=roughness/D)
-    dP_go = fd_go*L/D*(0.5*rhog*v_go**2)
+    if _is_array(x):
+        return _Theissing_array(m, x, rhol, rhog, mul, mug, D, roughness, L)
+    # Liquid-only and gas-only flow
+    (dP_lo, dP_go, _, _, Re_lo, Re_go, v_lo,
+     v_go, _) = _lo_go_dp(m, rhol, rhog, mul, mug, D, roughness, L)
 
     # Handle x = 0, x=1:
     if x == 0:
         return dP_lo
     elif x == 1:
         return dP_go
+    LoD = L/D
+    eD = roughness/D
 
     # Actual Liquid flow
-    v_l = m*(1-x)/rhol/(pi/4*D**2)
-    Re_l = Reynolds(V=v_l, rho=rhol, mu=mul, D=D)
-    fd_l = friction_factor(Re=Re_l, eD=roughness/D)
-    dP_l = fd_l*L/D*(0.5*rhol*v_l**2)
+    # Velocity and Reynolds number scale with the phase's mass fraction
+    v_l = v_lo*(1-x)
+    Re_l = Re_lo*(1-x)
+    fd_l = _ff(Re_l, eD)
+    dP_l = fd_l*LoD*(0.5*rhol*v_l*v_l)
 
     # Actual gas flow
-    v_g = m*x/rhog/(pi/4*D**2)
-    Re_g = Reynolds(V=v_g, rho=rhog, mu=mug, D=D)
-    fd_g = friction_factor(Re=Re_g, eD=roughness/D)
-    dP_g = fd_g*L/D*(0.5*rhog*v_g**2)
+    v_g = v_go*x
+    Re_g = Re_go*x
+    fd_g = _ff(Re_g, eD)
+    dP_g = fd_g*LoD*(0.5*rhog*v_g*v_g)
 
     # The model
-    n1 = log(dP_l/dP_lo)/log(1.-x)
-    n2 = log(dP_g/dP_go)/log(x)
-    n = (n1 + n2*(dP_g/dP_l)**0.1)/(1 + (dP_g/dP_l)**0.1)
+    ln1mx, lnx = log(1.-x), log(x)
+    n1 = log(dP_l/dP_lo)/ln1mx
+    n2 = log(dP_g/dP_go)/lnx
+    ratio = (dP_g/dP_l)**0.1
+    n = (n1 + n2*ratio)/(1 + ratio)
     epsilon = 3 - 2*(2*(rhol/rhog)**0.5/(1.+rhol/rhog))**(0.7/n)
-    dP = (dP_lo**(1./(n*epsilon))*(1-x)**(1./epsilon)
-          + dP_go**(1./(n*epsilon))*x**(1./epsilon))**(n*epsilon)
-    return dP
+    # (dP_lo**(1/ne)*(1-x)**(1/epsilon) + dP_go**(1/ne)*x**(1/epsilon))**ne
+    # evaluated as a log-sum-exp, which cannot overflow or underflow
+    ne = n*epsilon
+    a = log(dP_lo)/ne + ln1mx/epsilon
+    b = log(dP_go)/ne + lnx/epsilon
+    if a < b:
+        a, b = b, a
+    return exp(ne*(a + log1p(exp(b - a))))
 
 
 def Jung_Radermacher(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
@@ -968,7 +1048,7 @@ def Jung_Radermacher(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
     --------
     >>> Jung_Radermacher(m=0.6, x=0.1, rhol=915., rhog=2.67, mul=180E-6,
     ... mug=14E-6, D=0.05, roughness=0, L=1)
-    552.0686123725571
+    552.068612372557
 
     References
     ----------
@@ -986,13 +1066,23 @@ def Jung_Radermacher(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
        Tubes." Mathematical Modelling in Civil Engineering 10, no. 4 (2015):
        19-27. doi:10.2478/mmce-2014-0019.
     '''
-    v_lo = m/rhol/(pi/4*D**2)
+    if _is_array(x):
+        return _Jung_Radermacher_array(m, x, rhol, rhog, mul, mug, D,
+                                       roughness, L)
+    v_lo = _INV_QUARTER_PI*m/(D*D*rhol)
     Re_lo = Reynolds(V=v_lo, rho=rhol, mu=mul, D=D)
-    fd_lo = friction_factor(Re=Re_lo, eD=roughness/D)
-    dP_lo = fd_lo*L/D*(0.5*rhol*v_lo**2)
-
-    Xtt = Lockhart_Martinelli_Xtt(x, rhol, rhog, mul, mug)
-    phi_tp2 = 12.82*Xtt**-1.47*(1.-x)**1.8
+    fd_lo = _ff(Re_lo, roughness/D)
+    dP_lo = fd_lo*L/D*(0.5*rhol*v_lo*v_lo)
+
+    if x == 0.0 or x == 1.0:
+        # Xtt has a zero denominator or is zero and raised to a negative power
+        raise ZeroDivisionError('Jung_Radermacher is undefined at x = 0 and x = 1')
+
+    # Lockhart_Martinelli_Xtt inlined in log form; log(1-x) is shared with
+    # the (1-x)**1.8 term
+    ln1mx = log(1. - x)
+    ln_Xtt = 0.9*(ln1mx - log(x)) + 0.5*log(rhog/rhol) + 0.1*log(mul/mug)
+    phi_tp2 = 12.82*exp(1.8*ln1mx - 1.47*ln_Xtt)
     return phi_tp2*dP_lo
 
 
@@ -1048,7 +1138,7 @@ def Tran(m, x, rhol, rhog, mul, mug, sigma, D, roughness=0, L=1):
     --------
     >>> Tran(m=0.6, x=0.1, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6,
     ... sigma=0.0487, D=0.05, roughness=0, L=1)
-    423.2563312951232
+    423.25633129512323
 
     References
     ----------
@@ -1067,21 +1157,21 @@ def Tran(m, x, rhol, rhog, mul, mug, sigma, D, roughness=0, L=1):
        International Journal of Refrigeration 31, no. 1 (January 2008): 119-29.
        doi:10.1016/j.ijrefrig.2007.06.006.
     '''
-    # Liquid-only properties, for calculation of dP_lo
-    v_lo = m/rhol/(pi/4*D**2)
-    Re_lo = Reynolds(V=v_lo, rho=rhol, mu=mul, D=D)
-    fd_lo = friction_factor(Re=Re_lo, eD=roughness/D)
-    dP_lo = fd_lo*L/D*(0.5*rhol*v_lo**2)
-
-    # Gas-only properties, for calculation of dP_go
-    v_go = m/rhog/(pi/4*D**2)
-    Re_go = Reynolds(V=v_go, rho=rhog, mu=mug, D=D)
-    fd_go = friction_factor(Re=Re_go, eD=roughness/D)
-    dP_go = fd_go*L/D*(0.5*rhog*v_go**2)
+    if _is_array(x):
+        return _Tran_array(m, x, rhol, rhog, mul, mug, sigma, D, roughness, L)
+    dP_lo, dP_go = _lo_go_dp(m, rhol, rhog, mul, mug, D, roughness, L)[:2]
+    if x == 0.0:
+        return dP_lo
+    elif x == 1.0:
+        # Unlike most correlations, Tran's does not reduce to dP_go at x = 1
+        return 4.3*dP_go
+    elif not 0.0 < x < 1.0:
+        raise ValueError('Quality `x` must be between 0 and 1')
 
     Gamma2 = dP_go/dP_lo
-    Co = Confinement(D=D, rhol=rhol, rhog=rhog, sigma=sigma)
-    phi_lo2 = 1 + (4.3*Gamma2 -1)*(Co*x**0.875*(1-x)**0.875 + x**1.75)
+    Co = sqrt(sigma/(g*(rhol - rhog)))/D # Confinement(D, rhol, rhog, sigma)
+    x0875 = x**0.875 # x**1.75 is its square
+    phi_lo2 = 1 + (4.3*Gamma2 - 1.0)*(Co*x0875*exp(0.875*log1p(-x)) + x0875*x0875)
     return dP_lo*phi_lo2
 
 
@@ -1149,7 +1239,7 @@ def Chen_Friedel(m, x, rhol, rhog, mul, mug, sigma, D, roughness=0, L=1):
     --------
     >>> Chen_Friedel(m=.0005, x=0.9, rhol=950., rhog=1.4, mul=1E-3, mug=1E-5,
     ... sigma=0.02, D=0.003, roughness=0, L=1)
-    6249.247540588871
+    6249.247540588873
 
     References
     ----------
@@ -1167,45 +1257,49 @@ def Chen_Friedel(m, x, rhol, rhog, mul, mug, sigma, D, roughness=0, L=1):
        International Journal of Refrigeration 31, no. 1 (January 2008): 119-29.
        doi:10.1016/j.ijrefrig.2007.06.006.
     '''
+    if _is_array(x):
+        return _Chen_Friedel_array(m, x, rhol, rhog, mul, mug, sigma, D,
+                                   roughness, L)
+    G = _INV_QUARTER_PI*m/(D*D) # mass flux
+
     # Liquid-only properties, for calculation of E, dP_lo
-    v_lo = m/rhol/(pi/4*D**2)
-    Re_lo = Reynolds(V=v_lo, rho=rhol, mu=mul, D=D)
-    fd_lo = friction_factor(Re=Re_lo, eD=roughness/D)
-    dP_lo = fd_lo*L/D*(0.5*rhol*v_lo**2)
+    dP_lo, fd_lo, Re_lo, _ = _single_phase_props(m, D, rhol, mul, roughness, L)
 
     # Gas-only properties, for calculation of E
-    v_go = m/rhog/(pi/4*D**2)
-    Re_go = Reynolds(V=v_go, rho=rhog, mu=mug, D=D)
-    fd_go = friction_factor(Re=Re_go, eD=roughness/D)
+    _, fd_go, Re_go, _ = _single_phase_props(m, D, rhog, mug, roughness, L)
 
-    F = x**0.78*(1-x)**0.224
-    H = (rhol/rhog)**0.91*(mug/mul)**0.19*(1 - mug/mul)**0.7
-    E = (1-x)**2 + x**2*(rhol*fd_go/(rhog*fd_lo))
+    # F = x**0.78*(1-x)**0.224 and
+    # H = (rhol/rhog)**0.91*(mug/mul)**0.19*(1 - mug/mul)**0.7 from logarithms
+    if 0.0 < x < 1.0:
+        F = exp(0.78*log(x) + 0.224*log1p(-x))
+    else:
+        F = x**0.78*(1-x)**0.224
+    mu_ratio = mug/mul
+    H = exp(0.91*log(rhol/rhog) + 0.19*log(mu_ratio) + 0.7*log1p(-mu_ratio))
+    E = (1-x)*(1-x) + x*x*(rhol*fd_go/(rhog*fd_lo))
 
     # Homogeneous properties, for Froude/Weber numbers
     rho_h = 1./(x/rhog + (1-x)/rhol)
-    Q_h = m/rho_h
-    v_h = Q_h/(pi/4*D**2)
-
-    Fr = Froude(V=v_h, L=D, squared=True) # checked with (m/(pi/4*D**2))**2/g/D/rho_h**2
-    We = Weber(V=v_h, L=D, rho=rho_h, sigma=sigma) # checked with (m/(pi/4*D**2))**2*D/sigma/rho_h
+    v_h = G/rho_h
+    v_h2 = v_h*v_h
 
-    phi_lo2 = E + 3.24*F*H/(Fr**0.0454*We**0.035)
+    Fr = v_h2/(g*D) # Froude(V=v_h, L=D, squared=True)
+    We = rho_h*v_h2*D/sigma # Weber(V=v_h, L=D, rho=rho_h, sigma=sigma)
 
-    dP = phi_lo2*dP_lo
+    # 1/(Fr**0.0454*We**0.035)
+    phi_lo2 = E + 3.24*F*H*exp(-0.0454*log(Fr) - 0.035*log(We))
 
     # Chen modification; Weber number is the same as above
     # Weber is same
-    Bo = Bond(rhol=rhol, rhog=rhog, sigma=sigma, L=D)/4 # Custom definition
+    Bo = 0.25*g*(rhol - rhog)*D*D/sigma # Custom definition; Bond(...)/4
 
     if Bo < 2.5:
         # Actual gas flow, needed for this case only.
-        v_g = m*x/rhog/(pi/4*D**2)
-        Re_g = Reynolds(V=v_g, rho=rhog, mu=mug, D=D)
+        Re_g = Re_go*x
         Omega = 0.0333*Re_lo**0.45/(Re_g**0.09*(1 + 0.5*exp(-Bo)))
     else:
-        Omega = We**0.2/(2.5 + 0.06*Bo)
-    return dP*Omega
+        Omega = We**0.2/(0.06*Bo + 2.5)
+    return phi_lo2*dP_lo*Omega
 
 
 def Zhang_Webb(m, x, rhol, mul, P, Pc, D, roughness=0, L=1):
@@ -1256,7 +1350,7 @@ def Zhang_Webb(m, x, rhol, mul, P, Pc, D, roughness=0, L=1):
     --------
     >>> Zhang_Webb(m=0.6, x=0.1, rhol=915., mul=180E-6, P=2E5, Pc=4055000,
     ... D=0.05, roughness=0, L=1)
-    712.0999804205621
+    712.0999804205619
 
     References
     ----------
@@ -1269,14 +1363,15 @@ def Zhang_Webb(m, x, rhol, mul, P, Pc, D, roughness=0, L=1):
        International Journal of Refrigeration 31, no. 1 (January 2008): 119-29.
        doi:10.1016/j.ijrefrig.2007.06.006.
     '''
+    if _is_array(x):
+        return _Zhang_Webb_array(m, x, rhol, mul, P, Pc, D, roughness, L)
     # Liquid-only properties, for calculation of dP_lo
-    v_lo = m/rhol/(pi/4*D**2)
-    Re_lo = Reynolds(V=v_lo, rho=rhol, mu=mul, D=D)
-    fd_lo = friction_factor(Re=Re_lo, eD=roughness/D)
-    dP_lo = fd_lo*L/D*(0.5*rhol*v_lo**2)
+    dP_lo = _single_phase_props(m, D, rhol, mul, roughness, L)[0]
 
-    Pr = P/Pc
-    phi_lo2 = (1-x)**2 + 2.87*x**2/Pr + 1.68*x**0.8*(1-x)**0.25*Pr**-1.64
+    inv_Pr = Pc/P # 1/reduced pressure
+    omx = 1.0 - x
+    phi_lo2 = (omx*omx + 2.87*x*x*inv_Pr
+               + 1.68*x**0.8*omx**0.25*inv_Pr**1.64)
     return dP_lo*phi_lo2
 
 
@@ -1331,7 +1426,7 @@ def Bankoff(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
     --------
     >>> Bankoff(m=0.6, x=0.1, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6,
     ... D=0.05, roughness=0, L=1)
-    4746.059442453399
+    4746.0594424533965
 
     References
     ----------
@@ -1348,9 +1443,9 @@ def Bankoff(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
        State University, 2013. https://shareok.org/handle/11244/11109.
     '''
     # Liquid-only properties, for calculation of dP_lo
-    v_lo = m/rhol/(pi/4*D**2)
+    v_lo = m/rhol/(_QUARTER_PI*D*D)
     Re_lo = Reynolds(V=v_lo, rho=rhol, mu=mul, D=D)
-    fd_lo = friction_factor(Re=Re_lo, eD=roughness/D)
+    fd_lo = _ff(Re_lo, roughness/D)
     dP_lo = fd_lo*L/D*(0.5*rhol*v_lo**2)
 
     gamma = (0.71 + 2.35*rhog/rhol)/(1. + (1.-x)/x*rhog/rhol)
@@ -1426,17 +1521,18 @@ def Xu_Fang(m, x, rhol, rhog, mul, mug, sigma, D, roughness=0, L=1):
        Pressure Drop for Condensing Flow in Pipes." Nuclear Engineering and
        Design 263 (October 2013): 87-96. doi:10.1016/j.nucengdes.2013.04.017.
     '''
-    A = pi/4*D*D
+    A = _QUARTER_PI*D*D
     # Liquid-only properties, for calculation of E, dP_lo
     v_lo = m/rhol/A
     Re_lo = Reynolds(V=v_lo, rho=rhol, mu=mul, D=D)
-    fd_lo = friction_factor(Re=Re_lo, eD=roughness/D)
+    fd_lo = _ff(Re_lo, roughness/D)
     dP_lo = fd_lo*L/D*(0.5*rhol*v_lo**2)
 
     # Gas-only properties, for calculation of E
-    v_go = m/rhog/A
-    Re_go = Reynolds(V=v_go, rho=rhog, mu=mug, D=D)
-    fd_go = friction_factor(Re=Re_go, eD=roughness/D)
+    # Same mass flux, so these are the liquid-only values rescaled
+    v_go = v_lo*(rhol/rhog)
+    Re_go = Re_lo*(mul/mug)
+    fd_go = _ff(Re_go, roughness/D)
     dP_go = fd_go*L/D*(0.5*rhog*v_go**2)
 
     # Homogeneous properties, for Froude/Weber numbers
@@ -1445,9 +1541,10 @@ def Xu_Fang(m, x, rhol, rhog, mul, mug, sigma, D, roughness=0, L=1):
 
     Q_h = m/rho_h
     v_h = Q_h/A
+    v_h2 = v_h*v_h
 
-    Fr = Froude(V=v_h, L=D, squared=True)
-    We = Weber(V=v_h, L=D, rho=rho_h, sigma=sigma)
+    Fr = v_h2/(g*D) # Froude(V=v_h, L=D, squared=True)
+    We = rho_h*v_h2*D/sigma # Weber(V=v_h, L=D, rho=rho_h, sigma=sigma)
     Y2 = dP_go/dP_lo
 
     phi_lo2 = Y2*x**3 + (1-x**2.59)**0.632*(1 + 2*x**1.17*(Y2-1)
@@ -1503,7 +1600,7 @@ def Yu_France(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
     --------
     >>> Yu_France(m=0.6, x=.1, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6,
     ... D=0.05, roughness=0, L=1)
-    1146.983322553957
+    1146.9833225539571
 
     References
     ----------
@@ -1522,13 +1619,13 @@ def Yu_France(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
        2012): 86-97. doi:10.1016/j.nucengdes.2012.08.007.
     '''
     # Actual Liquid flow
-    v_l = m*(1-x)/rhol/(pi/4*D**2)
+    v_l = m*(1-x)/rhol/(_QUARTER_PI*D*D)
     Re_l = Reynolds(V=v_l, rho=rhol, mu=mul, D=D)
-    fd_l = friction_factor(Re=Re_l, eD=roughness/D)
+    fd_l = _ff(Re_l, roughness/D)
     dP_l = fd_l*L/D*(0.5*rhol*v_l**2)
 
     # Actual gas flow
-    v_g = m*x/rhog/(pi/4*D**2)
+    v_g = m*x/rhog/(_QUARTER_PI*D*D)
     Re_g = Reynolds(V=v_g, rho=rhog, mu=mug, D=D)
 
     X = 18.65*(rhog/rhol)**0.5*(1-x)/x*Re_g**0.1/Re_l**0.5
@@ -1589,7 +1686,7 @@ def Wang_Chiang_Lu(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
     --------
     >>> Wang_Chiang_Lu(m=0.6, x=0.1, rhol=915., rhog=2.67, mul=180E-6,
     ... mug=14E-6, D=0.05, roughness=0, L=1)
-    448.29981978639154
+    448.29981978639137
 
     References
     ----------
@@ -1607,18 +1704,18 @@ def Wang_Chiang_Lu(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
        in Pipes." Nuclear Engineering and Design, SI : CFD4NRS-3, 253 (December
        2012): 86-97. doi:10.1016/j.nucengdes.2012.08.007.
     '''
-    G_tp = m/(pi/4*D**2)
+    G_tp = m/(_QUARTER_PI*D*D)
 
     # Actual Liquid flow
-    v_l = m*(1-x)/rhol/(pi/4*D**2)
+    v_l = m*(1-x)/rhol/(_QUARTER_PI*D*D)
     Re_l = Reynolds(V=v_l, rho=rhol, mu=mul, D=D)
-    fd_l = friction_factor(Re=Re_l, eD=roughness/D)
+    fd_l = _ff(Re_l, roughness/D)
     dP_l = fd_l*L/D*(0.5*rhol*v_l**2)
 
     # Actual gas flow
-    v_g = m*x/rhog/(pi/4*D**2)
+    v_g = m*x/rhog/(_QUARTER_PI*D*D)
     Re_g = Reynolds(V=v_g, rho=rhog, mu=mug, D=D)
-    fd_g = friction_factor(Re=Re_g, eD=roughness/D)
+    fd_g = _ff(Re_g, roughness/D)
     dP_g = fd_g*L/D*(0.5*rhog*v_g**2)
 
     X = (dP_l/dP_g)**0.5
@@ -1627,7 +1724,7 @@ def Wang_Chiang_Lu(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
         phi_g2 = 1 + 9.397*X**0.62 + 0.564*X**2.45
     else:
         # Liquid-only flow; Re_lo is oddly needed
-        v_lo = m/rhol/(pi/4*D**2)
+        v_lo = m/rhol/(_QUARTER_PI*D*D)
         Re_lo = Reynolds(V=v_lo, rho=rhol, mu=mul, D=D)
         C = 0.000004566*X**0.128*Re_lo**0.938*(rhol/rhog)**-2.15*(mul/mug)**5.1
         phi_g2 = 1 + C*X + X**2
@@ -1706,24 +1803,24 @@ def Hwang_Kim(m, x, rhol, rhog, mul, mug, sigma, D, roughness=0, L=1):
        2012): 86-97. doi:10.1016/j.nucengdes.2012.08.007.
     '''
     # Liquid-only flow
-    v_lo = m/rhol/(pi/4*D**2)
+    v_lo = m/rhol/(_QUARTER_PI*D*D)
     Re_lo = Reynolds(V=v_lo, rho=rhol, mu=mul, D=D)
 
     # Actual Liquid flow
-    v_l = m*(1-x)/rhol/(pi/4*D**2)
+    v_l = m*(1-x)/rhol/(_QUARTER_PI*D*D)
     Re_l = Reynolds(V=v_l, rho=rhol, mu=mul, D=D)
-    fd_l = friction_factor(Re=Re_l, eD=roughness/D)
+    fd_l = _ff(Re_l, roughness/D)
     dP_l = fd_l*L/D*(0.5*rhol*v_l**2)
 
     # Actual gas flow
-    v_g = m*x/rhog/(pi/4*D**2)
+    v_g = m*x/rhog/(_QUARTER_PI*D*D)
     Re_g = Reynolds(V=v_g, rho=rhog, mu=mug, D=D)
-    fd_g = friction_factor(Re=Re_g, eD=roughness/D)
+    fd_g = _ff(Re_g, roughness/D)
     dP_g = fd_g*L/D*(0.5*rhog*v_g**2)
 
     # Actual model
     X = (dP_l/dP_g)**0.5
-    Co = Confinement(D=D, rhol=rhol, rhog=rhog, sigma=sigma)
+    Co = sqrt(sigma/(g*(rhol - rhog)))/D # Confinement(D, rhol, rhog, sigma)
     C = 0.227*Re_lo**0.452*X**-0.320*Co**-0.820
     phi_l2 = 1 + C/X + 1./X**2
     return dP_l*phi_l2
@@ -1815,20 +1912,20 @@ def Zhang_Hibiki_Mishima(m, x, rhol, rhog, mul, mug, sigma, D, roughness=0,
        2012): 86-97. doi:10.1016/j.nucengdes.2012.08.007.
     '''
     # Actual Liquid flow
-    v_l = m*(1-x)/rhol/(pi/4*D**2)
+    v_l = m*(1-x)/rhol/(_QUARTER_PI*D*D)
     Re_l = Reynolds(V=v_l, rho=rhol, mu=mul, D=D)
-    fd_l = friction_factor(Re=Re_l, eD=roughness/D)
+    fd_l = _ff(Re_l, roughness/D)
     dP_l = fd_l*L/D*(0.5*rhol*v_l**2)
 
     # Actual gas flow
-    v_g = m*x/rhog/(pi/4*D**2)
+    v_g = m*x/rhog/(_QUARTER_PI*D*D)
     Re_g = Reynolds(V=v_g, rho=rhog, mu=mug, D=D)
-    fd_g = friction_factor(Re=Re_g, eD=roughness/D)
+    fd_g = _ff(Re_g, roughness/D)
     dP_g = fd_g*L/D*(0.5*rhog*v_g**2)
 
     # Actual model
     X = (dP_l/dP_g)**0.5
-    Co = Confinement(D=D, rhol=rhol, rhog=rhog, sigma=sigma)
+    Co = sqrt(sigma/(g*(rhol - rhog)))/D # Confinement(D, rhol, rhog, sigma)
 
     if flowtype == 'adiabatic vapor':
         C = 21*(1 - exp(-0.142/Co))
@@ -1914,15 +2011,15 @@ def Mishima_Hibiki(m, x, rhol, rhog, mul, mug, sigma, D, roughness=0, L=1):
        2012): 86-97. doi:10.1016/j.nucengdes.2012.08.007.
     '''
     # Actual Liquid flow
-    v_l = m*(1-x)/rhol/(pi/4*D**2)
+    v_l = m*(1-x)/rhol/(_QUARTER_PI*D*D)
     Re_l = Reynolds(V=v_l, rho=rhol, mu=mul, D=D)
-    fd_l = friction_factor(Re=Re_l, eD=roughness/D)
+    fd_l = _ff(Re_l, roughness/D)
     dP_l = fd_l*L/D*(0.5*rhol*v_l**2)
 
     # Actual gas flow
-    v_g = m*x/rhog/(pi/4*D**2)
+    v_g = m*x/rhog/(_QUARTER_PI*D*D)
     Re_g = Reynolds(V=v_g, rho=rhog, mu=mug, D=D)
-    fd_g = friction_factor(Re=Re_g, eD=roughness/D)
+    fd_g = _ff(Re_g, roughness/D)
     dP_g = fd_g*L/D*(0.5*rhog*v_g**2)
 
     # Actual model
@@ -2048,19 +2145,19 @@ def Kim_Mudawar(m, x, rhol, rhog, mul, mug, sigma, D, L=1):
             return 0.184*Re**-0.2
 
     # Actual Liquid flow
-    v_l = m*(1-x)/rhol/(pi/4*D**2)
+    v_l = m*(1-x)/rhol/(_QUARTER_PI*D*D)
     Re_l = Reynolds(V=v_l, rho=rhol, mu=mul, D=D)
     fd_l = friction_factor(Re=Re_l)
     dP_l = fd_l*L/D*(0.5*rhol*v_l**2)
 
     # Actual gas flow
-    v_g = m*x/rhog/(pi/4*D**2)
+    v_g = m*x/rhog/(_QUARTER_PI*D*D)
     Re_g = Reynolds(V=v_g, rho=rhog, mu=mug, D=D)
     fd_g = friction_factor(Re=Re_g)
     dP_g = fd_g*L/D*(0.5*rhog*v_g**2)
 
     # Liquid-only flow
-    v_lo = m/rhol/(pi/4*D**2)
+    v_lo = m/rhol/(_QUARTER_PI*D*D)
     Re_lo = Reynolds(V=v_lo, rho=rhol, mu=mul, D=D)
 
     Su = Suratman(L=D, rho=rhog, mu=mug, sigma=sigma)
@@ -2190,9 +2287,9 @@ def Lockhart_Martinelli(m, x, rhol, rhog, mul, mug, D, L=1, Re_c=2000):
         else:
             return 0.184*Re**-0.2
 
-    v_l = m*(1-x)/rhol/(pi/4*D**2)
+    v_l = m*(1-x)/rhol/(_QUARTER_PI*D*D)
     Re_l = Reynolds(V=v_l, rho=rhol, mu=mul, D=D)
-    v_g = m*x/rhog/(pi/4*D**2)
+    v_g = m*x/rhog/(_QUARTER_PI*D*D)
     Re_g = Reynolds(V=v_g, rho=rhog, mu=mug, D=D)
 
     if Re_l < Re_c and Re_g < Re_c:
@@ -2217,6 +2314,826 @@ def Lockhart_Martinelli(m, x, rhol, rhog, mul, mug, D, L=1, Re_c=2000):
     return dP_l*phi_l2
 
 
+# Array implementations of the correlations above. These accept `x` (and any
+# other argument) as numpy arrays and evaluate every element in one pass;
+# the scalar functions call them when `x` is an array, and they are exposed
+# through `fluids.vectorized`. Keep their math in sync with the scalar
+# functions.
+
+def _as_float_array(a):
+    # float32 and float64 arrays keep their precision, so float32 inputs are
+    # calculated in float32; anything else, including float16 (in which the
+    # Reynolds numbers overflow) becomes float64
+    a = np.asarray(a)
+    if a.dtype == np.float32 or a.dtype == np.float64:
+        return a
+    return a.astype(np.float64)
+
+
+def _friction_factor_array(Re, eD):
+    # Equivalent of `friction_factor` with its default method - the laminar
+    # solution below `LAMINAR_TRANSITION_PIPE`, `Clamond` above it.
+    Re, eD = np.broadcast_arrays(_as_float_array(Re), _as_float_array(eD))
+    fd = np.empty(Re.shape, dtype=np.result_type(Re, eD))
+    np.divide(64., Re, out=fd)
+    turbulent = Re >= LAMINAR_TRANSITION_PIPE
+    if turbulent.any():
+        Re_t = Re[turbulent]
+        X1 = eD[turbulent]*Re_t*0.1239681863354175460160858261654858382699
+        X2 = np.log(Re_t) - 0.7793974884556819406441139701653776731705
+        F = X2 - 0.2
+        X1F = X1 + F
+        X1F1 = 1. + X1F
+        E = (np.log(X1F) - 0.2)/(X1F1)
+        F = F - (X1F1 + 0.5*E)*E*(X1F)/(X1F1 + E*(1. + 1.0/3.0*E))
+        X1F = X1 + F
+        X1F1 = 1. + X1F
+        E = (np.log(X1F) + F - X2)/(X1F1)
+        b = (X1F1 + E*(1. + 1.0/3.0*E))
+        F = b/(b*F - ((X1F1 + 0.5*E)*E*(X1F)))
+        fd[turbulent] = 1.325474527619599502640416597148504422899*(F*F)
+    return fd
+
+
+def _lo_go_dp_array(m, rhol, rhog, mul, mug, D, roughness, L):
+    A = _QUARTER_PI*D*D
+    eD = roughness/D
+    v_lo = m/(rhol*A)
+    Re_lo = rhol*v_lo*D/mul
+    fd_lo = _friction_factor_array(Re_lo, eD)
+    dP_lo = fd_lo*L/D*(0.5*rhol*v_lo*v_lo)
+
+    v_go = m/(rhog*A)
+    Re_go = rhog*v_go*D/mug
+    fd_go = _friction_factor_array(Re_go, eD)
+    dP_go = fd_go*L/D*(0.5*rhog*v_go*v_go)
+    return dP_lo, dP_go, fd_lo, fd_go, Re_lo, Re_go
+
+
+def _quality_logs_array(x):
+    # Powers of x and 1 - x are evaluated as exp(k*log(x)) from these, so each
+    # correlation needs only two logarithms of the quality. Endpoints give
+    # log(0) = -inf, for which exp correctly returns 0.
+    x = _as_float_array(x)
+    with np.errstate(divide='ignore'):
+        return x, np.log(x), np.log1p(-x)
+
+
+# numexpr, if installed, evaluates long elementwise expressions on large
+# arrays faster than numpy by working in cache-sized blocks on several threads
+# without temporary arrays; it is imported the first time it could be used.
+# With a single thread numpy's vectorized exp and log are faster, so it is
+# only used when numexpr is running more than one.
+_numexpr = None # False if not installed
+NUMEXPR_MIN_SIZE = 20000
+
+def _get_numexpr():
+    global _numexpr
+    if _numexpr is None:
+        try:
+            import numexpr as _numexpr
+        except ImportError: # pragma: no cover
+            _numexpr = False
+    return _numexpr
+
+
+def _friedel_core_array(x, lnx, ln1mx, rhol, rhog, mul, mug, sigma, D, G,
+                        fd_lo, fd_go):
+    # Friedel's two-phase multiplier phi_lo2, and the homogeneous Weber number
+    # which `Chen_Friedel` also needs. phi_lo2 is accumulated in place in a
+    # single array of the broadcast shape rather than through a temporary
+    # for each term.
+    shape = np.broadcast(x, rhol, rhog, mul, mug, sigma, D, G, fd_lo,
+                         fd_go).shape
+    dtype = np.result_type(x, rhol, rhog, mul, mug, sigma, D, G, fd_lo, fd_go)
+    omx = 1. - x
+    H = (rhol/rhog)**0.91*(mug/mul)**0.19*(1. - mug/mul)**0.7
+
+    v_h = np.empty(shape, dtype=dtype)
+    np.divide(omx, rhol, out=v_h)
+    v_h += x/rhog
+    v_h *= G
+    We = G*v_h*D/sigma
+
+    numexpr = _get_numexpr()
+    if (numexpr and dtype == np.float64 and numexpr.get_num_threads() > 1
+            and np.prod(shape, dtype=np.int64) >= NUMEXPR_MIN_SIZE):
+        phi_lo2 = numexpr.evaluate(
+            'omx*omx + x*x*E_ratio + H_324*exp(0.78*lnx + 0.224*ln1mx '
+            '- 0.0454*log(v_h*v_h*inv_gD) - 0.035*log(We))',
+            local_dict={'omx': omx, 'x': x, 'lnx': lnx, 'ln1mx': ln1mx,
+                        'v_h': v_h, 'We': We, 'H_324': 3.24*H,
+                        'inv_gD': 1.0/(g*D),
+                        'E_ratio': rhol*fd_go/(rhog*fd_lo)})
+        return phi_lo2, We
+
+    # F/(Fr**0.0454*We**0.035) as one exponential, with F = x**0.78*(1-x)**0.224
+    # and Fr = v_h**2/(g*D)
+    phi_lo2 = np.empty(shape, dtype=dtype)
+    np.log(v_h*v_h/(g*D), out=phi_lo2)
+    phi_lo2 *= -0.0454
+    phi_lo2 -= 0.035*np.log(We)
+    phi_lo2 += 0.78*lnx
+    phi_lo2 += 0.224*ln1mx
+    np.exp(phi_lo2, out=phi_lo2)
+    phi_lo2 *= 3.24*H
+    # E term
+    phi_lo2 += omx*omx
+    phi_lo2 += x*x*(rhol*fd_go/(rhog*fd_lo))
+    return phi_lo2, We
+
+
+def _Friedel_array(m, x, rhol, rhog, mul, mug, sigma, D, roughness=0, L=1,
+                   out=None):
+    x, lnx, ln1mx = _quality_logs_array(x)
+    dP_lo, _, fd_lo, fd_go, _, _ = _lo_go_dp_array(m, rhol, rhog, mul, mug, D,
+                                                   roughness, L)
+    G = m/(_QUARTER_PI*D*D)
+    phi_lo2, _ = _friedel_core_array(x, lnx, ln1mx, rhol, rhog, mul, mug,
+                                     sigma, D, G, fd_lo, fd_go)
+    return np.multiply(phi_lo2, dP_lo, out=out)
+
+
+def _Chen_Friedel_array(m, x, rhol, rhog, mul, mug, sigma, D, roughness=0,
+                        L=1, out=None):
+    x, lnx, ln1mx = _quality_logs_array(x)
+    (dP_lo, _, fd_lo, fd_go, Re_lo,
+     Re_go) = _lo_go_dp_array(m, rhol, rhog, mul, mug, D, roughness, L)
+    G = m/(_QUARTER_PI*D*D)
+    phi_lo2, We = _friedel_core_array(x, lnx, ln1mx, rhol, rhog, mul, mug,
+                                      sigma, D, G, fd_lo, fd_go)
+    Bo = 0.25*g*(rhol - rhog)*D*D/sigma # Custom definition
+
+    # Both Omega correlations are evaluated everywhere and the applicable one
+    # selected; the unused one may divide by zero at x = 0
+    Re_g = Re_go*x # actual gas flow
+    with np.errstate(divide='ignore'):
+        Omega_low = 0.0333*Re_lo**0.45/(Re_g**0.09*(1. + 0.5*np.exp(-Bo)))
+    Omega_high = We**0.2/(2.5 + 0.06*Bo)
+    Omega = np.where(Bo < 2.5, Omega_low, Omega_high)
+    return np.multiply(phi_lo2*dP_lo, Omega, out=out)
+
+
+def _Zhang_Webb_array(m, x, rhol, mul, P, Pc, D, roughness=0, L=1):
+    x, lnx, ln1mx = _quality_logs_array(x)
+    G = m/(_QUARTER_PI*D*D)
+    v_lo = G/rhol
+    fd_lo = _friction_factor_array(G*D/mul, roughness/D)
+    dP_lo = 0.5*fd_lo*L/D*G*v_lo
+
+    inv_Pr = Pc/P # 1/reduced pressure
+    omx = 1. - x
+    # (1-x)**2 + 2.87*x**2/Pr + 1.68*x**0.8*(1-x)**0.25*Pr**-1.64
+    phi_lo2 = (omx*omx + 2.87*x*x*inv_Pr
+               + 1.68*np.exp(0.8*lnx + 0.25*ln1mx + 1.64*np.log(inv_Pr)))
+    return dP_lo*phi_lo2
+
+
+def _Gronnerud_array(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
+    x = _as_float_array(x)
+    V = m/(_QUARTER_PI*D*D*rhol)
+    Frl = _as_float_array(V*V/(g*D))
+    with np.errstate(divide='ignore'):
+        ln_Frl = np.log(Frl)
+        f_Fr = np.where(Frl >= 1., 1., np.exp(0.3*ln_Frl) + 0.0055*ln_Frl*ln_Frl)
+    dP_dL_Fr = f_Fr*(x + 4.*(x**1.8 - x**10*f_Fr**0.5))
+    phi_gd = 1. + dP_dL_Fr*((rhol/rhog)/(mul/mug)**0.25 - 1.)
+
+    v_lo = V
+    Re_lo = rhol*v_lo*D/mul
+    fd_lo = _friction_factor_array(Re_lo, roughness/D)
+    dP_lo = fd_lo*L/D*(0.5*rhol*v_lo*v_lo)
+    return phi_gd*dP_lo
+
+
+def _compute_B_array(mode, Gamma, G_tp):
+    # Array version of `_compute_B`
+    sqrt_G = np.sqrt(G_tp)
+    low_Gamma = Gamma <= 9.5
+    mid_Gamma = Gamma <= 28.
+    high = 15000./(Gamma*Gamma*sqrt_G)
+    if mode == 'chisholm73':
+        return np.select([low_Gamma & (G_tp <= 500.),
+                          low_Gamma & (G_tp < 1900.), low_Gamma,
+                          mid_Gamma & (G_tp <= 600.), mid_Gamma],
+                         [4.8, 2400./G_tp, 55./sqrt_G, 520./(Gamma*sqrt_G),
+                          21./Gamma], default=high)
+    elif mode == 'baroczy':
+        return np.select([low_Gamma, mid_Gamma],
+                         [55./sqrt_G, 520./(Gamma*sqrt_G)], default=high)
+    raise Exception('Invalid mode for Chisholm B coefficient calculation')
+
+
+def _chisholm_core_array(m, x, rhol, rhog, mul, mug, D, roughness, L, mode,
+                         rough_correction=False, out=None):
+    # Array version of `_chisholm_core`
+    x = _as_float_array(x)
+    G_tp = m/(_QUARTER_PI*D*D)
+    dP_lo, dP_go, fd_lo, fd_go, Re_lo, Re_go = _lo_go_dp_array(m, rhol, rhog,
+                                                               mul, mug, D,
+                                                               roughness, L)
+    Gamma = np.sqrt(dP_go/dP_lo)
+    B = _compute_B_array(mode, Gamma, G_tp)
+    n = 0.25 # Blasius friction factor exponent
+    if rough_correction:
+        n = np.log(fd_lo/fd_go)/np.log(Re_go/Re_lo)
+        B_ratio = (0.5*(1. + (mug/mul)**2 + 10.**(-600.*roughness/D)))**((0.25 - n)/0.25)
+        B = B*B_ratio
+
+    half_exp = (2. - n)*0.5
+    x_half = x**half_exp
+    phi2_ch = 1. + (Gamma*Gamma - 1.)*(B*x_half*(1. - x)**half_exp
+                                       + x_half*x_half)
+    return np.multiply(phi2_ch, dP_lo, out=out)
+
+
+def _Chisholm_array(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1,
+                    rough_correction=False, out=None):
+    return _chisholm_core_array(m, x, rhol, rhog, mul, mug, D, roughness, L,
+                                'chisholm73', rough_correction, out)
+
+
+def _Baroczy_Chisholm_array(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
+    return _chisholm_core_array(m, x, rhol, rhog, mul, mug, D, roughness, L,
+                                'baroczy')
+
+
+def _Muller_Steinhagen_Heck_array(m, x, rhol, rhog, mul, mug, D, roughness=0,
+                                  L=1, out=None):
+    x = _as_float_array(x)
+    dP_lo, dP_go, _, _, _, _ = _lo_go_dp_array(m, rhol, rhog, mul, mug, D,
+                                               roughness, L)
+    G_MSH = dP_lo + 2.*(dP_go - dP_lo)*x
+    return np.add(G_MSH*np.cbrt(1. - x), dP_go*x*x*x, out=out)
+
+
+def _Lombardi_Pedrocchi_array(m, x, rhol, rhog, sigma, D, L=1):
+    x = _as_float_array(x)
+    rho_h = 1./(x/rhog + (1. - x)/rhol)
+    G_tp = m/(_QUARTER_PI*D*D)
+    return 0.83*G_tp**1.4*sigma**0.4*L/(D**1.2*rho_h**0.866)
+
+
+def _Theissing_array(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
+    x = _as_float_array(x)
+    A = _QUARTER_PI*D*D
+    eD = roughness/D
+    (dP_lo, dP_go, _, _, Re_lo,
+     Re_go) = _lo_go_dp_array(m, rhol, rhog, mul, mug, D, roughness, L)
+    # The endpoints x = 0 and x = 1 are substituted with the single-phase
+    # pressure drops at the end; silence the invalid values they produce.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Actual liquid flow
+        v_l = m*(1. - x)/(rhol*A)
+        Re_l = Re_lo*(1. - x)
+        fd_l = _friction_factor_array(Re_l, eD)
+        dP_l = fd_l*L/D*(0.5*rhol*v_l*v_l)
+
+        # Actual gas flow
+        v_g = m*x/(rhog*A)
+        Re_g = Re_go*x
+        fd_g = _friction_factor_array(Re_g, eD)
+        dP_g = fd_g*L/D*(0.5*rhog*v_g*v_g)
+
+        ln1mx, lnx = np.log1p(-x), np.log(x)
+        n1 = np.log(dP_l/dP_lo)/ln1mx
+        n2 = np.log(dP_g/dP_go)/lnx
+        ratio = (dP_g/dP_l)**0.1
+        n = (n1 + n2*ratio)/(1. + ratio)
+        epsilon = 3. - 2.*(2.*(rhol/rhog)**0.5/(1. + rhol/rhog))**(0.7/n)
+        ne = n*epsilon
+        dP = np.exp(ne*np.logaddexp(np.log(dP_lo)/ne + ln1mx/epsilon,
+                                    np.log(dP_go)/ne + lnx/epsilon))
+    return np.where(x == 0., dP_lo, np.where(x == 1., dP_go, dP))
+
+
+def _Jung_Radermacher_array(m, x, rhol, rhog, mul, mug, D, roughness=0, L=1):
+    x = _as_float_array(x)
+    v_lo = m/(rhol*_QUARTER_PI*D*D)
+    Re_lo = rhol*v_lo*D/mul
+    fd_lo = _friction_factor_array(Re_lo, roughness/D)
+    dP_lo = fd_lo*L/D*(0.5*rhol*v_lo*v_lo)
+
+    # Undefined at x = 0 and x = 1, where the scalar function raises
+    # ZeroDivisionError; those elements are NaN
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Xtt = ((1. - x)/x)**0.9*(rhog/rhol)**0.5*(mul/mug)**0.1
+        phi_tp2 = 12.82*Xtt**-1.47*(1. - x)**1.8
+    return np.where((x == 0.) | (x == 1.), np.nan, phi_tp2*dP_lo)
+
+
+def _Tran_array(m, x, rhol, rhog, mul, mug, sigma, D, roughness=0, L=1,
+               out=None):
+    x, lnx, ln1mx = _quality_logs_array(x)
+    dP_lo, dP_go, _, _, _, _ = _lo_go_dp_array(m, rhol, rhog, mul, mug, D,
+                                               roughness, L)
+    Gamma2 = dP_go/dP_lo
+    Co = (sigma/(g*(rhol - rhog)))**0.5/D
+    x0875 = np.exp(0.875*lnx)
+    # x**0.875*(1-x)**0.875 + x**1.75
+    x_terms = Co*np.exp(0.875*(lnx + ln1mx)) + x0875*x0875
+    phi_lo2 = 1. + (4.3*Gamma2 - 1.)*x_terms
+    return np.multiply(dP_lo, phi_lo2, out=out)
+
+
+two_phase_correlations_array = {
+    'Friedel': _Friedel_array,
+    'Chen_Friedel': _Chen_Friedel_array,
+    'Zhang_Webb': _Zhang_Webb_array,
+    'Gronnerud': _Gronnerud_array,
+    'Chisholm': _Chisholm_array,
+    'Baroczy_Chisholm': _Baroczy_Chisholm_array,
+    'Muller_Steinhagen_Heck': _Muller_Steinhagen_Heck_array,
+    'Lombardi_Pedrocchi': _Lombardi_Pedrocchi_array,
+    'Theissing': _Theissing_array,
+    'Jung_Radermacher': _Jung_Radermacher_array,
+    'Tran': _Tran_array,
+}
+
+
+def _many(f, args, out, **kwargs):
+    # The array kernels store their final product directly in `out`. The
+    # calculation is done in float32 only if every argument other than plain
+    # Python numbers is float32; a list or any other dtype gives float64.
+    arrays = [_as_float_array(arg) for arg in args]
+    array_dtypes = [a.dtype for a, arg in zip(arrays, args)
+                    if isinstance(arg, np.generic)
+                    or not isinstance(arg, (int, float))]
+    if array_dtypes and all(dt == np.float32 for dt in array_dtypes):
+        dtype = np.float32
+    else:
+        dtype = np.float64
+    args = np.broadcast_arrays(*[a.astype(dtype, copy=False) for a in arrays])
+    return f(*args, out=out, **kwargs)
+
+
+def Friedel_many(m, x, rhol, rhog, mul, mug, sigma, D, roughness=0.0, L=1.0,
+                 out=None):
+    r'''Calculates two-phase pressure drop with the Friedel correlation for
+    many sets of conditions at once. Every argument may be a scalar or an
+    array; they are broadcast together and the whole calculation is performed
+    with numpy array operations rather than one call to :obj:`Friedel` per
+    element. See :obj:`Friedel` for the correlation itself.
+
+    Parameters
+    ----------
+    m : array-like
+        Mass flow rate of fluid, [kg/s]
+    x : array-like
+        Quality of fluid, [-]
+    rhol : array-like
+        Liquid density, [kg/m^3]
+    rhog : array-like
+        Gas density, [kg/m^3]
+    mul : array-like
+        Viscosity of liquid, [Pa*s]
+    mug : array-like
+        Viscosity of gas, [Pa*s]
+    sigma : array-like
+        Surface tension, [N/m]
+    D : array-like
+        Diameter of pipe, [m]
+    roughness : array-like, optional
+        Roughness of pipe for use in calculating friction factor, [m]
+    L : array-like, optional
+        Length of pipe, [m]
+    out : ndarray, optional
+        Preallocated array of the broadcast shape to store the results in, [Pa]
+
+    Returns
+    -------
+    dP : ndarray
+        Pressure drop of the two-phase flow, [Pa]
+
+    Notes
+    -----
+    Requires numpy. The friction factors are calculated with the same method
+    as the default of :obj:`fluids.friction.friction_factor`, so results
+    match :obj:`Friedel` to within floating point rounding.
+
+    If every argument other than plain Python numbers is a float32 array or
+    scalar, the calculation is performed and the result returned in float32,
+    which is faster for large parameter sweeps and still far more precise
+    than the correlation itself. Otherwise, including when any argument is a
+    list, the calculation is in float64.
+
+    Examples
+    --------
+    >>> Friedel_many(m=0.6, x=[0.1, 0.5], rhol=915., rhog=2.67, mul=180E-6,
+    ... mug=14E-6, sigma=0.0487, D=0.05)
+    array([ 738.6500525 , 2729.08284272])
+    '''
+    return _many(_Friedel_array, (m, x, rhol, rhog, mul, mug, sigma, D,
+                                  roughness, L), out)
+
+
+def Chen_Friedel_many(m, x, rhol, rhog, mul, mug, sigma, D, roughness=0.0,
+                      L=1.0, out=None):
+    r'''Calculates two-phase pressure drop with the Chen modification of the
+    Friedel correlation for many sets of conditions at once. Arguments are
+    broadcast together, and float32 inputs calculated in float32, as in
+    :obj:`Friedel_many`; see :obj:`Chen_Friedel` for the correlation itself.
+
+    Parameters
+    ----------
+    m : array-like
+        Mass flow rate of fluid, [kg/s]
+    x : array-like
+        Quality of fluid, [-]
+    rhol : array-like
+        Liquid density, [kg/m^3]
+    rhog : array-like
+        Gas density, [kg/m^3]
+    mul : array-like
+        Viscosity of liquid, [Pa*s]
+    mug : array-like
+        Viscosity of gas, [Pa*s]
+    sigma : array-like
+        Surface tension, [N/m]
+    D : array-like
+        Diameter of pipe, [m]
+    roughness : array-like, optional
+        Roughness of pipe for use in calculating friction factor, [m]
+    L : array-like, optional
+        Length of pipe, [m]
+    out : ndarray, optional
+        Preallocated array of the broadcast shape to store the results in, [Pa]
+
+    Returns
+    -------
+    dP : ndarray
+        Pressure drop of the two-phase flow, [Pa]
+
+    Examples
+    --------
+    >>> Chen_Friedel_many(m=[0.0005, 0.6], x=0.9, rhol=950., rhog=1.4,
+    ... mul=1E-3, mug=1E-5, sigma=0.02, D=[0.003, 0.05])
+    array([6249.24754059, 4812.18837429])
+    '''
+    return _many(_Chen_Friedel_array, (m, x, rhol, rhog, mul, mug, sigma, D,
+                                       roughness, L), out)
+
+
+def Chisholm_many(m, x, rhol, rhog, mul, mug, D, roughness=0.0, L=1.0,
+                  rough_correction=False, out=None):
+    r'''Calculates two-phase pressure drop with the Chisholm (1973)
+    correlation for many sets of conditions at once. Arguments are broadcast
+    together, and float32 inputs calculated in float32, as in
+    :obj:`Friedel_many`; see :obj:`Chisholm` for the correlation itself.
+
+    Parameters
+    ----------
+    m : array-like
+        Mass flow rate of fluid, [kg/s]
+    x : array-like
+        Quality of fluid, [-]
+    rhol : array-like
+        Liquid density, [kg/m^3]
+    rhog : array-like
+        Gas density, [kg/m^3]
+    mul : array-like
+        Viscosity of liquid, [Pa*s]
+    mug : array-like
+        Viscosity of gas, [Pa*s]
+    D : array-like
+        Diameter of pipe, [m]
+    roughness : array-like, optional
+        Roughness of pipe for use in calculating friction factor, [m]
+    L : array-like, optional
+        Length of pipe, [m]
+    rough_correction : bool, optional
+        Whether or not to use the roughness correction proposed in the 1978
+        paper, [-]
+    out : ndarray, optional
+        Preallocated array of the broadcast shape to store the results in, [Pa]
+
+    Returns
+    -------
+    dP : ndarray
+        Pressure drop of the two-phase flow, [Pa]
+
+    Examples
+    --------
+    >>> Chisholm_many(m=0.6, x=[0.1, 0.5], rhol=915., rhog=2.67, mul=180E-6,
+    ... mug=14E-6, D=0.05)
+    array([1084.14899229, 3636.61862024])
+    '''
+    return _many(_Chisholm_array, (m, x, rhol, rhog, mul, mug, D, roughness, L),
+                 out, rough_correction=rough_correction)
+
+
+def Muller_Steinhagen_Heck_many(m, x, rhol, rhog, mul, mug, D, roughness=0.0,
+                                L=1.0, out=None):
+    r'''Calculates two-phase pressure drop with the Muller-Steinhagen and
+    Heck (1986) correlation for many sets of conditions at once. Arguments are
+    broadcast together, and float32 inputs calculated in float32, as in
+    :obj:`Friedel_many`; see :obj:`Muller_Steinhagen_Heck` for the
+    correlation itself.
+
+    Parameters
+    ----------
+    m : array-like
+        Mass flow rate of fluid, [kg/s]
+    x : array-like
+        Quality of fluid, [-]
+    rhol : array-like
+        Liquid density, [kg/m^3]
+    rhog : array-like
+        Gas density, [kg/m^3]
+    mul : array-like
+        Viscosity of liquid, [Pa*s]
+    mug : array-like
+        Viscosity of gas, [Pa*s]
+    D : array-like
+        Diameter of pipe, [m]
+    roughness : array-like, optional
+        Roughness of pipe for use in calculating friction factor, [m]
+    L : array-like, optional
+        Length of pipe, [m]
+    out : ndarray, optional
+        Preallocated array of the broadcast shape to store the results in, [Pa]
+
+    Returns
+    -------
+    dP : ndarray
+        Pressure drop of the two-phase flow, [Pa]
+
+    Examples
+    --------
+    >>> Muller_Steinhagen_Heck_many(m=0.6, x=[0.1, 0.5], rhol=915., rhog=2.67,
+    ... mul=180E-6, mug=14E-6, D=0.05)
+    array([ 793.44654574, 3686.05506132])
+    '''
+    return _many(_Muller_Steinhagen_Heck_array, (m, x, rhol, rhog, mul, mug, D,
+                                                 roughness, L), out)
+
+
+def Tran_many(m, x, rhol, rhog, mul, mug, sigma, D, roughness=0.0, L=1.0,
+              out=None):
+    r'''Calculates two-phase pressure drop with the Tran (2000) correlation for
+    many sets of conditions at once. Arguments are broadcast together, and
+    float32 inputs calculated in float32, as in :obj:`Friedel_many`; see
+    :obj:`Tran` for the correlation itself.
+
+    Parameters
+    ----------
+    m : array-like
+        Mass flow rate of fluid, [kg/s]
+    x : array-like
+        Quality of fluid, [-]
+    rhol : array-like
+        Liquid density, [kg/m^3]
+    rhog : array-like
+        Gas density, [kg/m^3]
+    mul : array-like
+        Viscosity of liquid, [Pa*s]
+    mug : array-like
+        Viscosity of gas, [Pa*s]
+    sigma : array-like
+        Surface tension, [N/m]
+    D : array-like
+        Diameter of pipe, [m]
+    roughness : array-like, optional
+        Roughness of pipe for use in calculating friction factor, [m]
+    L : array-like, optional
+        Length of pipe, [m]
+    out : ndarray, optional
+        Preallocated array of the broadcast shape to store the results in, [Pa]
+
+    Returns
+    -------
+    dP : ndarray
+        Pressure drop of the two-phase flow, [Pa]
+
+    Examples
+    --------
+    >>> Tran_many(m=0.6, x=[0.1, 0.5], rhol=915., rhog=2.67, mul=180E-6,
+    ... mug=14E-6, sigma=0.0487, D=0.05)
+    array([ 423.2563313, 5381.6771723])
+    '''
+    return _many(_Tran_array, (m, x, rhol, rhog, mul, mug, sigma, D, roughness,
+                               L), out)
+
+
+def make_Friedel(m, rhol, rhog, mul, mug, sigma, D, roughness=0.0, L=1.0):
+    r'''Creates a function calculating two-phase pressure drop with the
+    Friedel correlation at a varying quality `x`, for a fixed flow rate,
+    fluid pair and pipe. Everything in :obj:`Friedel` which does not depend
+    on the quality - the single-phase pressure drops and friction factors,
+    the `H` factor, and the fluid and flow parts of the Froude and Weber
+    numbers - is calculated once here, leaving three logarithms and one
+    exponential per point.
+
+    Parameters
+    ----------
+    m : float
+        Mass flow rate of fluid, [kg/s]
+    rhol : float
+        Liquid density, [kg/m^3]
+    rhog : float
+        Gas density, [kg/m^3]
+    mul : float
+        Viscosity of liquid, [Pa*s]
+    mug : float
+        Viscosity of gas, [Pa*s]
+    sigma : float
+        Surface tension, [N/m]
+    D : float
+        Diameter of pipe, [m]
+    roughness : float, optional
+        Roughness of pipe for use in calculating friction factor, [m]
+    L : float, optional
+        Length of pipe, [m]
+
+    Returns
+    -------
+    Friedel_x : callable
+        Function of the quality `x` [-] returning the pressure drop [Pa];
+        `x` may be a float or, if numpy is available, an array
+
+    Notes
+    -----
+    The homogeneous Froude and Weber numbers are
+    :math:`Fr = G_{tp}^2/(\rho_h^2 gD)` and
+    :math:`We = G_{tp}^2 D/(\rho_h\sigma)`, so the quality enters
+    :math:`Fr^{-0.0454}We^{-0.035}` only through
+    :math:`(1/\rho_h)^{-0.1258}`, with :math:`1/\rho_h` linear in `x`.
+
+    Examples
+    --------
+    >>> Friedel_x = make_Friedel(m=0.6, rhol=915., rhog=2.67, mul=180E-6,
+    ... mug=14E-6, sigma=0.0487, D=0.05)
+    >>> Friedel_x(0.1)
+    738.6500525002247
+    '''
+    (dP_lo, dP_go, fd_lo, fd_go, _, _, _, _,
+     G_tp) = _lo_go_dp(m, rhol, rhog, mul, mug, D, roughness, L)
+    mu_ratio = mug/mul
+    H = exp(0.91*log(rhol/rhog) + 0.19*log(mu_ratio) + 0.7*log1p(-mu_ratio))
+    E_ratio = rhol*fd_go/(rhog*fd_lo)
+    inv_rhol, inv_rhog = 1.0/rhol, 1.0/rhog
+    G2 = G_tp*G_tp
+    # 3.24*H*Fr**-0.0454*We**-0.035 with the (1/rho_h) terms taken out
+    K = 3.24*H*exp(-0.0454*log(G2/(g*D)) - 0.035*log(G2*D/sigma))
+
+    def Friedel_x(x):
+        if isinstance(x, (float, int)):
+            if x == 0.0:
+                return dP_lo
+            elif x == 1.0:
+                return dP_go
+            elif not 0.0 < x < 1.0:
+                raise ValueError('Quality `x` must be between 0 and 1')
+            inv_rho_h = x*inv_rhog + (1.0 - x)*inv_rhol
+            return dP_lo*((1.0 - x)*(1.0 - x) + x*x*E_ratio
+                          + K*exp(0.78*log(x) + 0.224*log1p(-x)
+                                  - 0.1258*log(inv_rho_h)))
+        x, lnx, ln1mx = _quality_logs_array(x)
+        inv_rho_h = x*inv_rhog + (1.0 - x)*inv_rhol
+        return dP_lo*((1.0 - x)*(1.0 - x) + x*x*E_ratio
+                      + K*np.exp(0.78*lnx + 0.224*ln1mx
+                                 - 0.1258*np.log(inv_rho_h)))
+    return Friedel_x
+
+
+def make_Chen_Friedel(m, rhol, rhog, mul, mug, sigma, D, roughness=0.0,
+                      L=1.0):
+    r'''Creates a function calculating two-phase pressure drop with the
+    Chen modification of the Friedel correlation at a varying quality `x`,
+    for a fixed flow rate, fluid pair and pipe. As in
+    :obj:`make_Friedel`, the parts of :obj:`Chen_Friedel` which do not
+    depend on the quality are calculated once here; so is the Bond number,
+    which selects between the two forms of the :math:`\Omega` factor.
+
+    Parameters
+    ----------
+    m : float
+        Mass flow rate of fluid, [kg/s]
+    rhol : float
+        Liquid density, [kg/m^3]
+    rhog : float
+        Gas density, [kg/m^3]
+    mul : float
+        Viscosity of liquid, [Pa*s]
+    mug : float
+        Viscosity of gas, [Pa*s]
+    sigma : float
+        Surface tension, [N/m]
+    D : float
+        Diameter of pipe, [m]
+    roughness : float, optional
+        Roughness of pipe for use in calculating friction factor, [m]
+    L : float, optional
+        Length of pipe, [m]
+
+    Returns
+    -------
+    Chen_Friedel_x : callable
+        Function of the quality `x` [-] returning the pressure drop [Pa];
+        `x` may be a float or, if numpy is available, an array
+
+    Examples
+    --------
+    >>> Chen_Friedel_x = make_Chen_Friedel(m=.0005, rhol=950., rhog=1.4,
+    ... mul=1E-3, mug=1E-5, sigma=0.02, D=0.003)
+    >>> Chen_Friedel_x(0.9)
+    6249.247540588873
+    '''
+    (dP_lo, _, fd_lo, fd_go, Re_lo, Re_go, _, _,
+     G_tp) = _lo_go_dp(m, rhol, rhog, mul, mug, D, roughness, L)
+    mu_ratio = mug/mul
+    H = exp(0.91*log(rhol/rhog) + 0.19*log(mu_ratio) + 0.7*log1p(-mu_ratio))
+    E_ratio = rhol*fd_go/(rhog*fd_lo)
+    inv_rhol, inv_rhog = 1.0/rhol, 1.0/rhog
+    G2 = G_tp*G_tp
+    We_coeff = G2*D/sigma # We = We_coeff/rho_h
+    K = 3.24*H*exp(-0.0454*log(G2/(g*D)) - 0.035*log(We_coeff))
+
+    Bo = 0.25*g*(rhol - rhog)*D*D/sigma # Custom definition; Bond(...)/4
+    low_Bo = Bo < 2.5
+    if low_Bo:
+        # Omega = C_Omega*x**-0.09
+        C_Omega = 0.0333*Re_lo**0.45/(Re_go**0.09*(1 + 0.5*exp(-Bo)))
+    else:
+        # Omega = C_Omega*(1/rho_h)**0.2
+        C_Omega = We_coeff**0.2/(0.06*Bo + 2.5)
+
+    def Chen_Friedel_x(x):
+        if isinstance(x, (float, int)):
+            inv_rho_h = x*inv_rhog + (1.0 - x)*inv_rhol
+            ln_inv_rho_h = log(inv_rho_h)
+            if 0.0 < x < 1.0:
+                F_term = K*exp(0.78*log(x) + 0.224*log1p(-x)
+                               - 0.1258*ln_inv_rho_h)
+            else:
+                F_term = 0.0
+            phi_lo2 = (1.0 - x)*(1.0 - x) + x*x*E_ratio + F_term
+            if low_Bo:
+                return dP_lo*phi_lo2*C_Omega*x**-0.09
+            return dP_lo*phi_lo2*C_Omega*exp(0.2*ln_inv_rho_h)
+        x, lnx, ln1mx = _quality_logs_array(x)
+        ln_inv_rho_h = np.log(x*inv_rhog + (1.0 - x)*inv_rhol)
+        phi_lo2 = ((1.0 - x)*(1.0 - x) + x*x*E_ratio
+                   + K*np.exp(0.78*lnx + 0.224*ln1mx - 0.1258*ln_inv_rho_h))
+        with np.errstate(divide='ignore', over='ignore'):
+            Omega = C_Omega*np.exp(-0.09*lnx if low_Bo else 0.2*ln_inv_rho_h)
+        return dP_lo*phi_lo2*Omega
+    return Chen_Friedel_x
+
+
+def make_Zhang_Webb(m, rhol, mul, P, Pc, D, roughness=0.0, L=1.0):
+    r'''Creates a function calculating two-phase pressure drop with the
+    Zhang-Webb correlation at a varying quality `x`, for a fixed flow rate,
+    fluid, pressure and pipe. The liquid-only pressure drop and the reduced
+    pressure terms of :obj:`Zhang_Webb` are calculated once here.
+
+    Parameters
+    ----------
+    m : float
+        Mass flow rate of fluid, [kg/s]
+    rhol : float
+        Liquid density, [kg/m^3]
+    mul : float
+        Viscosity of liquid, [Pa*s]
+    P : float
+        Pressure of fluid, [Pa]
+    Pc : float
+        Critical pressure of fluid, [Pa]
+    D : float
+        Diameter of pipe, [m]
+    roughness : float, optional
+        Roughness of pipe for use in calculating friction factor, [m]
+    L : float, optional
+        Length of pipe, [m]
+
+    Returns
+    -------
+    Zhang_Webb_x : callable
+        Function of the quality `x` [-] returning the pressure drop [Pa];
+        `x` may be a float or, if numpy is available, an array
+
+    Examples
+    --------
+    >>> Zhang_Webb_x = make_Zhang_Webb(m=0.6, rhol=915., mul=180E-6,
+    ... P=2E5, Pc=4055000, D=0.05)
+    >>> Zhang_Webb_x(0.1)
+    712.0999804205619
+    '''
+    dP_lo = _single_phase_props(m, D, rhol, mul, roughness, L)[0]
+    inv_Pr = Pc/P # 1/reduced pressure
+    c_x2 = 2.87*inv_Pr
+    c_mixed = 1.68*inv_Pr**1.64
+
+    def Zhang_Webb_x(x):
+        if isinstance(x, (float, int)):
+            return dP_lo*((1.0 - x)*(1.0 - x) + c_x2*x*x
+                          + c_mixed*x**0.8*(1.0 - x)**0.25)
+        x, lnx, ln1mx = _quality_logs_array(x)
+        return dP_lo*((1.0 - x)*(1.0 - x) + c_x2*x*x
+                      + c_mixed*np.exp(0.8*lnx + 0.25*ln1mx))
+    return Zhang_Webb_x
+
+
 two_phase_correlations = {
     # 0 index, args are: m, x, rhol, mul, P, Pc, D, roughness=0, L=1
     'Zhang_Webb': (Zhang_Webb, 0),
@@ -2455,7 +3372,7 @@ def two_phase_dP_acceleration(m, D, xi, xo, alpha_i, alpha_o, rho_li, rho_gi,
     --------
     >>> two_phase_dP_acceleration(m=1, D=0.1, xi=0.372, xo=0.557, rho_li=827.1,
     ... rho_gi=3.919, alpha_i=0.992, alpha_o=0.996)
-    706.8560377214725
+    706.8560377214723
     
     References
     ----------
@@ -2471,7 +3388,7 @@ def two_phase_dP_acceleration(m, D, xi, xo, alpha_i, alpha_o, rho_li, rho_gi,
        Mass Transfer 77 (October 2014): 74-97.
        doi:10.1016/j.ijheatmasstransfer.2014.04.035.
     '''
-    G = 4*m/(pi*D*D)
+    G = _INV_QUARTER_PI*m/(D*D)
     if rho_lo is None:
         rho_lo = rho_li
     if rho_go is None:
@@ -2555,7 +3472,7 @@ def two_phase_dP_dz_acceleration(m, D, x, rhol, rhog, dv_dP_l, dv_dP_g, dx_dP,
        Mass Transfer 77 (October 2014): 74-97.
        doi:10.1016/j.ijheatmasstransfer.2014.04.035.
     '''  
-    A = 0.25*pi*D*D
+    A = _QUARTER_PI*D*D
     G = m/A
     t1 = (1.0/rhog - 1.0/rhol)*dP_dL*dx_dP + dP_dL*(x*dv_dP_g + (1.0 - x)*dv_dP_l)
 
@@ -2813,18 +3730,18 @@ def Taitel_Dukler_regime(m, x, rhol, rhog, mul, mug,  D, angle, roughness=0,
        2006.
     '''
     angle = radians(angle)
-    A = 0.25*pi*D*D
+    A = _QUARTER_PI*D*D
     # Liquid-superficial properties, for calculation of dP_ls, dP_ls
     # Paper and Brill Beggs 1991 confirms not v_lo but v_sg
     v_ls =  m*(1.0 - x)/(rhol*A)
     Re_ls = Reynolds(V=v_ls, rho=rhol, mu=mul, D=D)
-    fd_ls = friction_factor(Re=Re_ls, eD=roughness/D)
+    fd_ls = _ff(Re_ls, roughness/D)
     dP_ls = fd_ls/D*(0.5*rhol*v_ls*v_ls)
 
     # Gas-superficial properties, for calculation of dP_gs
     v_gs = m*x/(rhog*A)
     Re_gs = Reynolds(V=v_gs, rho=rhog, mu=mug, D=D)
-    fd_gs = friction_factor(Re=Re_gs, eD=roughness/D)
+    fd_gs = _ff(Re_gs, roughness/D)
     dP_gs = fd_gs/D*(0.5*rhog*v_gs*v_gs)
     
     X = (dP_ls/dP_gs)**0.5
@@ -2927,7 +3844,7 @@ def Mandhane_Gregory_Aziz_regime(m, x, rhol, rhog, mul, mug, sigma, D,
        Multiphase Flow 1, no. 4 (October 30, 1974): 537-53. 
        doi:10.1016/0301-9322(74)90006-8.
     '''
-    A = 0.25*pi*D*D
+    A = _QUARTER_PI*D*D
     Vsl =  m*(1.0 - x)/(rhol*A)
     Vsg = m*x/(rhog*A)
     
@@ -0,0 +1,680 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+from __future__ import division
+from math import pi, log, exp, sqrt
+from fluids.constants import g
+from fluids.friction import LAMINAR_TRANSITION_PIPE
+from fluids.numerics import numpy as np
+
+'''Module with versions of the two-phase pressure drop correlations in
+`fluids.two_phase` compiled with `numba <https://numba.pydata.org>`_.
+The functions have the same signatures and give the same results as those in
+`fluids.two_phase`, but are many times faster when called repeatedly from a
+loop. If numba is not installed, the same functions are still available and
+run as ordinary Python; `IS_NUMBA` indicates which is the case.
+
+>>> from fluids.two_phase_nb import Friedel
+>>> Friedel(m=0.6, x=0.1, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6,
+... sigma=0.0487, D=0.05, roughness=0.0, L=1.0)
+738.6500525002243
+
+Each function is a thin wrapper providing the default arguments around a
+compiled function with the suffix `_nb` (i.e. `Friedel_nb`), which takes
+every argument positionally. Numba dispatches calls with omitted default
+arguments very slowly, so the `_nb` functions are the ones to call from
+other numba-compiled code.
+
+The first call of each function compiles it, which takes a second or so; the
+compiled code is cached on disk so this only happens once.
+
+Two kinds of compiled closures can be created. `make_Friedel`,
+`make_Chen_Friedel` and `make_Zhang_Webb` take the same arguments as the
+functions of the same names in `fluids.two_phase` and return a function of
+the quality alone. `make_Friedel_geometry` fixes only the pipe, returning a
+function of the flow rate, quality and fluid properties.
+
+`Friedel_ufunc`, `Chen_Friedel_ufunc` and `Zhang_Webb_ufunc` are NumPy ufuncs
+of the same correlations, calculating their elements in parallel. A ufunc is
+compiled for all of its input types when it is created, so these are only
+built the first time they are accessed, i.e.
+`from fluids.two_phase_nb import Friedel_ufunc`; for the same reason they
+are not included in star imports.
+'''
+
+__all__ = ['Friedel', 'Gronnerud', 'Chisholm', 'Baroczy_Chisholm',
+           'Muller_Steinhagen_Heck', 'Lombardi_Pedrocchi', 'Theissing',
+           'Jung_Radermacher', 'Tran', 'Chen_Friedel', 'Zhang_Webb',
+           'Friedel_nb', 'Gronnerud_nb', 'Chisholm_nb', 'Baroczy_Chisholm_nb',
+           'Muller_Steinhagen_Heck_nb', 'Lombardi_Pedrocchi_nb',
+           'Theissing_nb', 'Jung_Radermacher_nb', 'Tran_nb', 'Chen_Friedel_nb',
+           'Zhang_Webb_nb',
+           'friedel_along_pipe', 'make_Friedel_geometry', 'make_Friedel',
+           'make_Chen_Friedel', 'make_Zhang_Webb', 'Friedel_gpu', 'IS_NUMBA',
+           'IS_CUDA']
+
+try:
+    from numba import njit, prange, vectorize
+    jit = njit(cache=True, fastmath=True, error_model='numpy')
+    parallel_jit = njit(cache=True, fastmath=True, error_model='numpy',
+                        parallel=True)
+    # Closures are compiled anew for each set of captured values and cannot
+    # be cached on disk
+    closure_jit = njit(fastmath=True, error_model='numpy')
+    IS_NUMBA = True
+except ImportError:
+    def jit(f):
+        return f
+    parallel_jit = closure_jit = jit
+    prange = range
+    IS_NUMBA = False
+
+# Compiled functions cannot raise cheaply in parallel loops or on a GPU, so a
+# quality outside [0, 1] gives NaN rather than the ValueError of
+# fluids.two_phase
+_NAN = float('nan')
+
+try:
+    from numba import cuda
+    IS_CUDA = cuda.is_available()
+except ImportError:
+    IS_CUDA = False
+
+
+@jit
+def Reynolds(V, rho, mu, D):
+    return rho*V*D/mu
+
+
+@jit
+def Froude(V, L):
+    return V*V/(g*L)
+
+
+@jit
+def homogeneous(x, rhol, rhog):
+    return 1.0/(1.0 + (1.0 - x)/x*(rhog/rhol))
+
+
+@jit
+def Lockhart_Martinelli_Xtt(x, rhol, rhog, mul, mug):
+    return ((1.0 - x)/x)**0.9*(rhog/rhol)**0.5*(mul/mug)**0.1
+
+
+@jit
+def friction_factor(Re, eD):
+    # Laminar solution or the `Clamond` solution to the Colebrook equation,
+    # as used by default in `fluids.friction.friction_factor`
+    if Re < LAMINAR_TRANSITION_PIPE:
+        return 64.0/Re
+    X1 = eD*Re*0.1239681863354175460160858261654858382699
+    X2 = log(Re) - 0.7793974884556819406441139701653776731705
+    F = X2 - 0.2
+    X1F = X1 + F
+    X1F1 = 1. + X1F
+    E = (log(X1F) - 0.2)/(X1F1)
+    F = F - (X1F1 + 0.5*E)*E*(X1F)/(X1F1 + E*(1. + 1.0/3.0*E))
+    X1F = X1 + F
+    X1F1 = 1. + X1F
+    E = (log(X1F) + F - X2)/(X1F1)
+    b = (X1F1 + E*(1. + 1.0/3.0*E))
+    F = b/(b*F - ((X1F1 + 0.5*E)*E*(X1F)))
+    return 1.325474527619599502640416597148504422899*(F*F)
+
+
+@jit
+def _lo_go_dp(m, rhol, rhog, mul, mug, D, roughness, L):
+    A_inv = 4.0/(pi*D*D)
+    LoD = L/D
+    eD = roughness/D
+    G_tp = m*A_inv
+
+    v_lo = G_tp/rhol
+    Re_lo = Reynolds(v_lo, rhol, mul, D)
+    fd_lo = friction_factor(Re_lo, eD)
+    dP_lo = fd_lo*LoD*(0.5*rhol*v_lo*v_lo)
+
+    v_go = G_tp/rhog
+    Re_go = Reynolds(v_go, rhog, mug, D)
+    fd_go = friction_factor(Re_go, eD)
+    dP_go = fd_go*LoD*(0.5*rhog*v_go*v_go)
+    return dP_lo, dP_go, fd_lo, fd_go, Re_lo, Re_go, v_lo, v_go, G_tp
+
+
+@jit
+def Friedel_nb(m, x, rhol, rhog, mul, mug, sigma, D, roughness, L):
+    '''Version of :obj:`Friedel` taking every argument positionally, for
+    calls from other numba-compiled code.'''
+    (dP_lo, dP_go, fd_lo, fd_go, _, _, _, _,
+     G_tp) = _lo_go_dp(m, rhol, rhog, mul, mug, D, roughness, L)
+    if x == 0.0:
+        return dP_lo
+    elif x == 1.0:
+        return dP_go
+    elif not 0.0 < x < 1.0:
+        return _NAN # quality outside [0, 1]
+
+    F = x**0.78*(1.0 - x)**0.224
+    H = (rhol/rhog)**0.91*(mug/mul)**0.19*(1.0 - mug/mul)**0.7
+    E = (1.0 - x)**2 + x**2*(rhol*fd_go/(rhog*fd_lo))
+
+    voidage_h = homogeneous(x, rhol, rhog)
+    rho_h = rhol*(1.0 - voidage_h) + rhog*voidage_h
+    v_h = G_tp/rho_h
+    v_h2 = v_h*v_h
+    Fr = v_h2/(g*D)
+    We = rho_h*v_h2*D/sigma
+
+    phi_lo2 = E + 3.24*F*H*exp(-0.0454*log(Fr) - 0.035*log(We))
+    return phi_lo2*dP_lo
+
+
+@jit
+def Gronnerud_nb(m, x, rhol, rhog, mul, mug, D, roughness, L):
+    '''Version of :obj:`Gronnerud` taking every argument positionally, for
+    calls from other numba-compiled code.'''
+    v_lo = 4.0*m/(pi*D*D*rhol)
+    Frl = Froude(v_lo, D)
+    if Frl >= 1.0:
+        f_Fr = 1.0
+    else:
+        f_Fr = Frl**0.3 + 0.0055*(log(1./Frl))**2
+    dP_dL_Fr = f_Fr*(x + 4.0*(x**1.8 - x**10*sqrt(f_Fr)))
+    phi_gd = 1.0 + dP_dL_Fr*((rhol/rhog)/(mul/mug)**0.25 - 1.0)
+
+    Re_lo = Reynolds(v_lo, rhol, mul, D)
+    fd_lo = friction_factor(Re_lo, roughness/D)
+    dP_lo = fd_lo*L/D*(0.5*rhol*v_lo*v_lo)
+    return phi_gd*dP_lo
+
+
+@jit
+def _compute_B(mode, Gamma, G_tp):
+    # Chisholm's `B` coefficient; 'chisholm73' is the full schedule of
+    # Chisholm (1973), 'baroczy' the simpler one used with Baroczy's model
+    if mode == 'chisholm73':
+        if Gamma <= 9.5:
+            if G_tp <= 500.0:
+                return 4.8
+            elif G_tp < 1900.0:
+                return 2400./G_tp
+            return 55.0/sqrt(G_tp)
+        elif Gamma <= 28.0:
+            if G_tp <= 600.0:
+                return 520./(sqrt(G_tp)*Gamma)
+            return 21./Gamma
+        return 15000./(sqrt(G_tp)*Gamma*Gamma)
+    elif mode == 'baroczy':
+        if Gamma <= 9.5:
+            return 55.0/sqrt(G_tp)
+        elif Gamma <= 28.0:
+            return 520./(sqrt(G_tp)*Gamma)
+        return 15000./(sqrt(G_tp)*Gamma*Gamma)
+    raise Exception('Invalid mode for Chisholm B coefficient calculation')
+
+
+@jit
+def _chisholm_core(m, x, rhol, rhog, mul, mug, D, roughness, L, mode,
+                   rough_correction):
+    # Shared body of `Chisholm_nb` and `Baroczy_Chisholm_nb`, which differ
+    # only in how `B` is computed
+    n = 0.25 # Blasius friction factor exponent
+    (dP_lo, dP_go, fd_lo, fd_go, Re_lo, Re_go, _, _,
+     G_tp) = _lo_go_dp(m, rhol, rhog, mul, mug, D, roughness, L)
+    if x == 0.0:
+        return dP_lo
+    elif x == 1.0:
+        return dP_go
+    elif not 0.0 < x < 1.0:
+        return _NAN # quality outside [0, 1]
+
+    Gamma = sqrt(dP_go/dP_lo)
+    B = _compute_B(mode, Gamma, G_tp)
+
+    if rough_correction:
+        n = log(fd_lo/fd_go)/log(Re_go/Re_lo)
+        B_ratio = (0.5*(1.0 + (mug/mul)**2 + 10.0**(-600.0*roughness/D)))**((0.25 - n)/0.25)
+        B = B*B_ratio
+
+    half_exp = (2.0 - n)*0.5
+    x_half = x**half_exp
+    phi2_ch = 1.0 + (Gamma*Gamma - 1.0)*(B*x_half*(1.0 - x)**half_exp
+                                         + x_half*x_half)
+    return phi2_ch*dP_lo
+
+
+@jit
+def Chisholm_nb(m, x, rhol, rhog, mul, mug, D, roughness, L, rough_correction):
+    '''Version of :obj:`Chisholm` taking every argument positionally, for
+    calls from other numba-compiled code.'''
+    return _chisholm_core(m, x, rhol, rhog, mul, mug, D, roughness, L,
+                          'chisholm73', rough_correction)
+
+
+@jit
+def Baroczy_Chisholm_nb(m, x, rhol, rhog, mul, mug, D, roughness, L):
+    '''Version of :obj:`Baroczy_Chisholm` taking every argument
+    positionally, for calls from other numba-compiled code.'''
+    return _chisholm_core(m, x, rhol, rhog, mul, mug, D, roughness, L,
+                          'baroczy', False)
+
+
+@jit
+def Muller_Steinhagen_Heck_nb(m, x, rhol, rhog, mul, mug, D, roughness, L):
+    '''Version of :obj:`Muller_Steinhagen_Heck` taking every argument
+    positionally, for calls from other numba-compiled code.'''
+    dP_lo, dP_go, _, _, _, _, _, _, _ = _lo_go_dp(m, rhol, rhog, mul, mug, D,
+                                                  roughness, L)
+    G_MSH = dP_lo + 2.0*(dP_go - dP_lo)*x
+    return G_MSH*(1.0 - x)**(1.0/3.0) + dP_go*x*x*x
+
+
+@jit
+def Lombardi_Pedrocchi_nb(m, x, rhol, rhog, sigma, D, L):
+    '''Version of :obj:`Lombardi_Pedrocchi` taking every argument
+    positionally, for calls from other numba-compiled code.'''
+    voidage_h = homogeneous(x, rhol, rhog)
+    rho_h = rhol*(1.0 - voidage_h) + rhog*voidage_h
+    G_tp = 4.0*m/(pi*D*D)
+    return 0.83*G_tp**1.4*sigma**0.4*L/(D**1.2*rho_h**0.866)
+
+
+@jit
+def Theissing_nb(m, x, rhol, rhog, mul, mug, D, roughness, L):
+    '''Version of :obj:`Theissing` taking every argument positionally, for
+    calls from other numba-compiled code.'''
+    (dP_lo, dP_go, _, _, _, _, v_lo,
+     v_go, _) = _lo_go_dp(m, rhol, rhog, mul, mug, D, roughness, L)
+    if x == 0.0:
+        return dP_lo
+    elif x == 1.0:
+        return dP_go
+    LoD = L/D
+    eD = roughness/D
+
+    # Actual liquid flow
+    v_l = v_lo*(1.0 - x)
+    Re_l = Reynolds(v_l, rhol, mul, D)
+    fd_l = friction_factor(Re_l, eD)
+    dP_l = fd_l*LoD*(0.5*rhol*v_l*v_l)
+
+    # Actual gas flow
+    v_g = v_go*x
+    Re_g = Reynolds(v_g, rhog, mug, D)
+    fd_g = friction_factor(Re_g, eD)
+    dP_g = fd_g*LoD*(0.5*rhog*v_g*v_g)
+
+    n1 = log(dP_l/dP_lo)/log(1.0 - x)
+    n2 = log(dP_g/dP_go)/log(x)
+    n = (n1 + n2*(dP_g/dP_l)**0.1)/(1.0 + (dP_g/dP_l)**0.1)
+    epsilon = 3.0 - 2.0*(2.0*sqrt(rhol/rhog)/(1.0 + rhol/rhog))**(0.7/n)
+    return (dP_lo**(1.0/(n*epsilon))*(1.0 - x)**(1.0/epsilon)
+            + dP_go**(1.0/(n*epsilon))*x**(1.0/epsilon))**(n*epsilon)
+
+
+@jit
+def Jung_Radermacher_nb(m, x, rhol, rhog, mul, mug, D, roughness, L):
+    '''Version of :obj:`Jung_Radermacher` taking every argument
+    positionally, for calls from other numba-compiled code.'''
+    v_lo = 4.0*m/(pi*D*D*rhol)
+    Re_lo = Reynolds(v_lo, rhol, mul, D)
+    fd_lo = friction_factor(Re_lo, roughness/D)
+    dP_lo = fd_lo*L/D*(0.5*rhol*v_lo*v_lo)
+
+    if x == 0.0 or x == 1.0:
+        raise ZeroDivisionError('Jung_Radermacher is undefined at x = 0 and x = 1')
+    Xtt = Lockhart_Martinelli_Xtt(x, rhol, rhog, mul, mug)
+    phi_tp2 = 12.82*Xtt**-1.47*(1.0 - x)**1.8
+    return phi_tp2*dP_lo
+
+
+@jit
+def Tran_nb(m, x, rhol, rhog, mul, mug, sigma, D, roughness, L):
+    '''Version of :obj:`Tran` taking every argument positionally, for calls
+    from other numba-compiled code.'''
+    dP_lo, dP_go, _, _, _, _, _, _, _ = _lo_go_dp(m, rhol, rhog, mul, mug, D,
+                                                  roughness, L)
+    if x == 0.0:
+        return dP_lo
+    elif x == 1.0:
+        return 4.3*dP_go
+    elif not 0.0 < x < 1.0:
+        return _NAN # quality outside [0, 1]
+
+    Gamma2 = dP_go/dP_lo
+    Co = sqrt(sigma/(g*(rhol - rhog)))/D
+    x0875 = x**0.875
+    phi_lo2 = 1.0 + (4.3*Gamma2 - 1.0)*(Co*x0875*(1.0 - x)**0.875 + x0875*x0875)
+    return dP_lo*phi_lo2
+
+
+@jit
+def Chen_Friedel_nb(m, x, rhol, rhog, mul, mug, sigma, D, roughness, L):
+    '''Version of :obj:`Chen_Friedel` taking every argument positionally,
+    for calls from other numba-compiled code.'''
+    (dP_lo, _, fd_lo, fd_go, Re_lo, Re_go, _, _,
+     G_tp) = _lo_go_dp(m, rhol, rhog, mul, mug, D, roughness, L)
+    F = x**0.78*(1.0 - x)**0.224
+    H = (rhol/rhog)**0.91*(mug/mul)**0.19*(1.0 - mug/mul)**0.7
+    E = (1.0 - x)*(1.0 - x) + x*x*(rhol*fd_go/(rhog*fd_lo))
+
+    rho_h = 1.0/(x/rhog + (1.0 - x)/rhol)
+    v_h = G_tp/rho_h
+    v_h2 = v_h*v_h
+    Fr = v_h2/(g*D)
+    We = rho_h*v_h2*D/sigma
+    dP = (E + 3.24*F*H*exp(-0.0454*log(Fr) - 0.035*log(We)))*dP_lo
+
+    Bo = 0.25*g*(rhol - rhog)*D*D/sigma # Custom definition; Bond(...)/4
+    if Bo < 2.5:
+        Re_g = Re_go*x # actual gas flow
+        Omega = 0.0333*Re_lo**0.45/(Re_g**0.09*(1.0 + 0.5*exp(-Bo)))
+    else:
+        Omega = We**0.2/(2.5 + 0.06*Bo)
+    return dP*Omega
+
+
+@jit
+def Zhang_Webb_nb(m, x, rhol, mul, P, Pc, D, roughness, L):
+    '''Version of :obj:`Zhang_Webb` taking every argument positionally, for
+    calls from other numba-compiled code.'''
+    G = 4.0*m/(pi*D*D)
+    v_lo = G/rhol
+    fd_lo = friction_factor(G*D/mul, roughness/D)
+    dP_lo = 0.5*fd_lo*L/D*G*v_lo
+
+    inv_Pr = Pc/P
+    omx = 1.0 - x
+    phi_lo2 = (omx*omx + 2.87*x*x*inv_Pr
+               + 1.68*x**0.8*omx**0.25*inv_Pr**1.64)
+    return dP_lo*phi_lo2
+
+
+@parallel_jit
+def friedel_along_pipe(m, x, rhol, rhog, mul, mug, sigma, D, roughness, dL,
+                       out):
+    '''Calculates the frictional pressure drop with the Friedel correlation in
+    each of a series of pipe cells, i.e. those of a discretized pipe in which
+    the quality and fluid properties change along its length. Every argument
+    is a 1D array with one entry per cell; `dL` holds the cell lengths and the
+    pressure drops are stored in `out`, which is also returned. With numba,
+    the cells are calculated in parallel.
+
+    >>> import numpy as np
+    >>> N = 3
+    >>> ones = np.ones(N)
+    >>> friedel_along_pipe(0.6*ones, np.array([0.1, 0.2, 0.3]), 915.*ones,
+    ... 2.67*ones, 180E-6*ones, 14E-6*ones, 0.0487*ones, 0.05*ones,
+    ... np.zeros(N), 0.5*ones, np.empty(N))
+    array([369.32502625, 610.81283032, 849.26589802])
+    '''
+    for i in prange(x.shape[0]):
+        out[i] = Friedel_nb(m[i], x[i], rhol[i], rhog[i], mul[i], mug[i],
+                            sigma[i], D[i], roughness[i], dL[i])
+    return out
+
+
+def _ufunc(nargs):
+    # Compiles a scalar function of `nargs` floats into a NumPy ufunc whose
+    # elements are calculated in parallel, in float32 if every input is
+    # float32 and float64 otherwise; without numba, `np.vectorize` gives the
+    # same broadcasting behavior
+    if IS_NUMBA:
+        return vectorize(['%s(%s)' %(t, ', '.join([t]*nargs))
+                          for t in ('float64', 'float32')],
+                         target='parallel', cache=True)
+    return lambda f: np.vectorize(f, otypes=[np.float64])
+
+
+# Scalar bodies of the NumPy ufuncs of the Friedel, Chen_Friedel and
+# Zhang_Webb correlations. The ufuncs broadcast their arguments like any other
+# ufunc and support `out=`; as with the `_nb` functions, every argument
+# including `roughness` and `L` must be given.
+def _Friedel_ufunc(m, x, rhol, rhog, mul, mug, sigma, D, roughness, L):
+    return Friedel_nb(m, x, rhol, rhog, mul, mug, sigma, D, roughness, L)
+
+
+def _Chen_Friedel_ufunc(m, x, rhol, rhog, mul, mug, sigma, D, roughness, L):
+    return Chen_Friedel_nb(m, x, rhol, rhog, mul, mug, sigma, D, roughness, L)
+
+
+def _Zhang_Webb_ufunc(m, x, rhol, mul, P, Pc, D, roughness, L):
+    return Zhang_Webb_nb(m, x, rhol, mul, P, Pc, D, roughness, L)
+
+
+_ufunc_bodies = {'Friedel_ufunc': (_Friedel_ufunc, 10),
+                 'Chen_Friedel_ufunc': (_Chen_Friedel_ufunc, 10),
+                 'Zhang_Webb_ufunc': (_Zhang_Webb_ufunc, 9)}
+
+
+def __getattr__(name):
+    # Builds each ufunc on first access and keeps it as a module attribute
+    try:
+        f, nargs = _ufunc_bodies[name]
+    except KeyError:
+        raise AttributeError("module %r has no attribute %r" %(__name__, name))
+    ufunc = globals()[name] = _ufunc(nargs)(f)
+    return ufunc
+
+
+def make_Friedel_geometry(D, L=1.0, roughness=0.0, sigma=None):
+    '''Creates a version of the Friedel correlation specialized for a pipe of
+    fixed diameter, length and roughness, and optionally a fixed surface
+    tension. The returned function calls :obj:`Friedel_nb` with these values
+    compiled in as constants, so quantities which depend only on them - the
+    flow area, `L/D`, `roughness/D` and so on - are folded by the compiler.
+
+    The returned function has the signature `f(m, x, rhol, rhog, mul, mug)`,
+    or `f(m, x, rhol, rhog, mul, mug, sigma)` if `sigma` is not specified.
+    Each call of `make_Friedel_geometry` compiles a new function, so it should
+    be called once per geometry and the result reused. :obj:`make_Friedel`
+    instead fixes everything but the quality.
+
+    >>> f = make_Friedel_geometry(D=0.05, L=1.0, roughness=0.0, sigma=0.0487)
+    >>> f(0.6, 0.1, 915., 2.67, 180E-6, 14E-6)
+    738.6500525002243
+    '''
+    @closure_jit
+    def Friedel_specialized(m, x, rhol, rhog, mul, mug, sigma):
+        return Friedel_nb(m, x, rhol, rhog, mul, mug, sigma, D, roughness, L)
+
+    if sigma is None:
+        return Friedel_specialized
+
+    @closure_jit
+    def Friedel_specialized_sigma(m, x, rhol, rhog, mul, mug):
+        return Friedel_specialized(m, x, rhol, rhog, mul, mug, sigma)
+    return Friedel_specialized_sigma
+
+
+def make_Friedel(m, rhol, rhog, mul, mug, sigma, D, roughness=0.0, L=1.0):
+    '''Compiled version of :obj:`fluids.two_phase.make_Friedel`; creates a
+    function of the quality `x` alone for a fixed flow rate, fluid pair and
+    pipe, which calls :obj:`Friedel_nb` with the other values compiled in as
+    constants. The returned function takes a float.
+
+    Each call compiles a new function, so it should be made once per set of
+    conditions and the result reused. To compile one function for a pipe and
+    call it with varying flow rates and fluids, use
+    :obj:`make_Friedel_geometry` instead.
+
+    >>> Friedel_x = make_Friedel(m=0.6, rhol=915., rhog=2.67, mul=180E-6,
+    ... mug=14E-6, sigma=0.0487, D=0.05)
+    >>> Friedel_x(0.1)
+    738.6500525002243
+    '''
+    @closure_jit
+    def Friedel_x(x):
+        return Friedel_nb(m, x, rhol, rhog, mul, mug, sigma, D, roughness, L)
+    return Friedel_x
+
+
+def make_Chen_Friedel(m, rhol, rhog, mul, mug, sigma, D, roughness=0.0,
+                      L=1.0):
+    '''Compiled version of :obj:`fluids.two_phase.make_Chen_Friedel`; see
+    :obj:`make_Friedel`.'''
+    @closure_jit
+    def Chen_Friedel_x(x):
+        return Chen_Friedel_nb(m, x, rhol, rhog, mul, mug, sigma, D,
+                               roughness, L)
+    return Chen_Friedel_x
+
+
+def make_Zhang_Webb(m, rhol, mul, P, Pc, D, roughness=0.0, L=1.0):
+    '''Compiled version of :obj:`fluids.two_phase.make_Zhang_Webb`; see
+    :obj:`make_Friedel`.'''
+    @closure_jit
+    def Zhang_Webb_x(x):
+        return Zhang_Webb_nb(m, x, rhol, mul, P, Pc, D, roughness, L)
+    return Zhang_Webb_x
+
+
+if IS_CUDA:
+    _friction_factor_cuda = cuda.jit(device=True)(friction_factor.py_func)
+
+    @cuda.jit(device=True)
+    def _Friedel_cuda(m, x, rhol, rhog, mul, mug, sigma, D, roughness, L):
+        G_tp = 4.0*m/(pi*D*D)
+        eD = roughness/D
+        v_lo = G_tp/rhol
+        fd_lo = _friction_factor_cuda(G_tp*D/mul, eD)
+        dP_lo = fd_lo*L/D*(0.5*rhol*v_lo*v_lo)
+        v_go = G_tp/rhog
+        fd_go = _friction_factor_cuda(G_tp*D/mug, eD)
+        if x == 0.0:
+            return dP_lo
+        elif x == 1.0:
+            return fd_go*L/D*(0.5*rhog*v_go*v_go)
+        elif not 0.0 < x < 1.0:
+            return _NAN # quality outside [0, 1]
+
+        F = x**0.78*(1.0 - x)**0.224
+        H = (rhol/rhog)**0.91*(mug/mul)**0.19*(1.0 - mug/mul)**0.7
+        E = (1.0 - x)*(1.0 - x) + x*x*(rhol*fd_go/(rhog*fd_lo))
+
+        rho_h = 1.0/(x/rhog + (1.0 - x)/rhol)
+        v_h = G_tp/rho_h
+        Fr = v_h*v_h/(g*D)
+        We = rho_h*v_h*v_h*D/sigma
+        return (E + 3.24*F*H/(Fr**0.0454*We**0.035))*dP_lo
+
+    @cuda.jit
+    def _Friedel_kernel(m, x, rhol, rhog, mul, mug, sigma, D, roughness, L,
+                        out):
+        i = cuda.grid(1)
+        if i < out.shape[0]:
+            out[i] = _Friedel_cuda(m[i], x[i], rhol[i], rhog[i], mul[i],
+                                   mug[i], sigma[i], D[i], roughness[i], L[i])
+
+
+def Friedel_gpu(m, x, rhol, rhog, mul, mug, sigma, D, roughness=0.0, L=1.0,
+                threshold=100000):
+    '''Calculates two-phase pressure drop with the Friedel correlation for
+    many sets of conditions at once, on a CUDA GPU if one is available. All
+    arguments may be scalars or arrays and are broadcast together.
+
+    Transferring the inputs to the GPU takes longer than calculating a few
+    thousand points on the CPU, so the GPU is only used when there are at
+    least `threshold` points; otherwise, or when numba's CUDA support or a
+    GPU is not available (see `IS_CUDA`), the points are calculated with
+    :obj:`friedel_along_pipe`.
+
+    >>> Friedel_gpu(m=0.6, x=[0.1, 0.5], rhol=915., rhog=2.67, mul=180E-6,
+    ... mug=14E-6, sigma=0.0487, D=0.05)
+    array([ 738.6500525 , 2729.08284272])
+    '''
+    args = np.broadcast_arrays(*[np.asarray(v, dtype=np.float64) for v in
+                                 (m, x, rhol, rhog, mul, mug, sigma, D,
+                                  roughness, L)])
+    shape = args[0].shape
+    args = [np.ascontiguousarray(v.ravel()) for v in args]
+    N = args[0].shape[0]
+    out = np.empty(N)
+    if IS_CUDA and N >= threshold:
+        threads_per_block = 256
+        blocks = (N + threads_per_block - 1)//threads_per_block
+        args_gpu = [cuda.to_device(v) for v in args]
+        out_gpu = cuda.device_array(N, dtype=np.float64)
+        _Friedel_kernel[blocks, threads_per_block](*(args_gpu + [out_gpu]))
+        out_gpu.copy_to_host(out)
+    else:
+        friedel_along_pipe(*(args + [out]))
+    return out.reshape(shape)
+
+
+def Friedel(m, x, rhol, rhog, mul, mug, sigma, D, roughness=0.0, L=1.0):
+    '''Numba version of :obj:`fluids.two_phase.Friedel`.'''
+    return Friedel_nb(m, x, rhol, rhog, mul, mug, sigma, D, roughness, L)
+
+
+def Gronnerud(m, x, rhol, rhog, mul, mug, D, roughness=0.0, L=1.0):
+    '''Numba version of :obj:`fluids.two_phase.Gronnerud`.'''
+    return Gronnerud_nb(m, x, rhol, rhog, mul, mug, D, roughness, L)
+
+
+def Chisholm(m, x, rhol, rhog, mul, mug, D, roughness=0.0, L=1.0,
+             rough_correction=False):
+    '''Numba version of :obj:`fluids.two_phase.Chisholm`.'''
+    return Chisholm_nb(m, x, rhol, rhog, mul, mug, D, roughness, L,
+                       rough_correction)
+
+
+def Baroczy_Chisholm(m, x, rhol, rhog, mul, mug, D, roughness=0.0, L=1.0):
+    '''Numba version of :obj:`fluids.two_phase.Baroczy_Chisholm`.'''
+    return Baroczy_Chisholm_nb(m, x, rhol, rhog, mul, mug, D, roughness, L)
+
+
+def Muller_Steinhagen_Heck(m, x, rhol, rhog, mul, mug, D, roughness=0.0,
+                           L=1.0):
+    '''Numba version of :obj:`fluids.two_phase.Muller_Steinhagen_Heck`.'''
+    return Muller_Steinhagen_Heck_nb(m, x, rhol, rhog, mul, mug, D, roughness,
+                                     L)
+
+
+def Lombardi_Pedrocchi(m, x, rhol, rhog, sigma, D, L=1.0):
+    '''Numba version of :obj:`fluids.two_phase.Lombardi_Pedrocchi`.'''
+    return Lombardi_Pedrocchi_nb(m, x, rhol, rhog, sigma, D, L)
+
+
+def Theissing(m, x, rhol, rhog, mul, mug, D, roughness=0.0, L=1.0):
+    '''Numba version of :obj:`fluids.two_phase.Theissing`.'''
+    return Theissing_nb(m, x, rhol, rhog, mul, mug, D, roughness, L)
+
+
+def Jung_Radermacher(m, x, rhol, rhog, mul, mug, D, roughness=0.0, L=1.0):
+    '''Numba version of :obj:`fluids.two_phase.Jung_Radermacher`.'''
+    return Jung_Radermacher_nb(m, x, rhol, rhog, mul, mug, D, roughness, L)
+
+
+def Tran(m, x, rhol, rhog, mul, mug, sigma, D, roughness=0.0, L=1.0):
+    '''Numba version of :obj:`fluids.two_phase.Tran`.'''
+    return Tran_nb(m, x, rhol, rhog, mul, mug, sigma, D, roughness, L)
+
+
+def Chen_Friedel(m, x, rhol, rhog, mul, mug, sigma, D, roughness=0.0, L=1.0):
+    '''Numba version of :obj:`fluids.two_phase.Chen_Friedel`.'''
+    return Chen_Friedel_nb(m, x, rhol, rhog, mul, mug, sigma, D, roughness, L)
+
+
+def Zhang_Webb(m, x, rhol, mul, P, Pc, D, roughness=0.0, L=1.0):
+    '''Numba version of :obj:`fluids.two_phase.Zhang_Webb`.'''
+    return Zhang_Webb_nb(m, x, rhol, mul, P, Pc, D, roughness, L)
@@ -37,6 +37,10 @@ Inputs do not need to be numpy arrays; they can be any iterable:
 >>> fluids.vectorized.friction_factor(Re=[100, 1000, 10000], eD=0)
 array([ 0.64      ,  0.064     ,  0.03088295])
 
+Some functions, such as several of the two-phase pressure drop correlations,
+have native array implementations; these are used instead of numpy's
+vectorize and evaluate every element in a single pass.
+
 Note that because this needs to import fluids itself, fluids.vectorized
 needs to be imported separately; the following will cause an error:
     
@@ -57,6 +61,10 @@ bad_names = set(('__file__', '__name__', '__package__', '__cached__'))
 
 for name in dir(normal_fluids):
     obj = getattr(normal_fluids, name)
+    if name.startswith('make_'):
+        # Factories return a function of quality which already takes arrays;
+        # they are not themselves evaluated element-wise
+        continue
     if isinstance(obj, types.FunctionType):
         obj = np.vectorize(obj)
     elif isinstance(obj, str):
@@ -66,6 +74,40 @@ for name in dir(normal_fluids):
     __funcs.update({name: obj})
 #    globals()[name] = obj
 
+# Correlations with native array implementations are used directly instead of
+# through numpy's vectorize, which calls the scalar function once per element.
+# The array implementations take only numeric arrays; calls with an array of
+# anything else (such as several values of Chisholm's `rough_correction`)
+# still go through numpy's vectorize.
+def __wrap_array_function(name, f):
+    scalar_f = getattr(normal_fluids, name)
+    vectorized_f = np.vectorize(scalar_f)
+    def array_f(*args, **kwargs):
+        args = [np.asarray(arg) for arg in args]
+        kwargs = {k: np.asarray(v) for k, v in kwargs.items()}
+        for v in args + list(kwargs.values()):
+            if v.ndim and v.dtype.kind not in 'iuf':
+                return vectorized_f(*args, **kwargs)
+        return f(*args, **kwargs)
+    array_f.__name__ = scalar_f.__name__
+    array_f.__doc__ = ('''Array version of :obj:`fluids.two_phase.%s`, which
+    documents the arguments. Every argument may be a scalar or array-like;
+    they are broadcast together and evaluated with numpy in a single pass,
+    returning an array.''' %(name))
+    return array_f
+
+for name, f in normal_fluids.two_phase.two_phase_correlations_array.items():
+    __funcs[name] = __wrap_array_function(name, f)
+
+# Functions which already operate on arrays are exported unchanged
+for name in normal_fluids.two_phase.__all__:
+    if name.endswith('_many'):
+        __funcs[name] = getattr(normal_fluids.two_phase, name)
+
+# The main library's __all__ is re-exported above; drop the factories from it
+__funcs['__all__'] = [name for name in normal_fluids.__all__
+                      if not name.startswith('make_')]
+
 globals().update(__funcs)
 
 
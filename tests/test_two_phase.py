@@ -110,6 +110,14 @@ def test_Friedel():
     # 730 is the result in [1]_; they use the Blassius equation instead for friction
     # the multiplier was calculated to be 38.871 vs 38.64 in [6]_
 
+    # Pure liquid and pure gas
+    kwargs = dict(m=0.6, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6, sigma=0.0487, D=0.05, roughness=0, L=1)
+    assert_allclose(Friedel(x=0, **kwargs), 19.00276790390895)
+    assert_allclose(Friedel(x=1, **kwargs), 4012.248776469056)
+    for x in [-1E-9, 1.0 + 1E-9, 2.0]:
+        with pytest.raises(ValueError):
+            Friedel(x=x, **kwargs)
+
 
 def test_Gronnerud():
     kwargs = dict(m=0.6, x=0.1, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6, D=0.05, roughness=0, L=1)
@@ -160,6 +168,16 @@ def test_Chisholm():
     dP = Chisholm(**kwargs)
     assert_allclose(dP, dP_expect*10)
 
+    # Pure liquid and pure gas
+    kwargs = dict(m=0.6, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6, D=0.05, roughness=0, L=1)
+    assert_allclose(Chisholm(x=0, **kwargs), 19.00276790390895)
+    assert_allclose(Chisholm(x=1, **kwargs), 4012.248776469056)
+    for x in [-1E-9, 1.0 + 1E-9]:
+        with pytest.raises(ValueError):
+            Chisholm(x=x, **kwargs)
+        with pytest.raises(ValueError):
+            Baroczy_Chisholm(x=x, **kwargs)
+
 
 def test_Baroczy_Chisholm():
     # Gamma < 28, G< 600
@@ -235,6 +253,17 @@ def test_Jung_Radermacher():
     dP = Jung_Radermacher(**kwargs)
     assert_allclose(dP, dP_expect*10)
 
+    # Undefined for single-phase flow
+    for x in [0.0, 1.0]:
+        with pytest.raises(ZeroDivisionError):
+            Jung_Radermacher(**dict(kwargs, x=x))
+
+    # Array qualities; the endpoints are NaN
+    xs = np.array([0.0, 1E-4, 0.1, 0.5, 0.9, 0.9999, 1.0])
+    dPs = Jung_Radermacher(**dict(kwargs, x=xs))
+    assert np.isnan(dPs[0]) and np.isnan(dPs[-1])
+    assert_allclose(dPs[1:-1], [Jung_Radermacher(**dict(kwargs, x=x)) for x in xs[1:-1]], rtol=1E-12)
+
 
 def test_Tran():
     kwargs = dict(m=0.6, x=0.1, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6, sigma=0.0487, D=0.05, roughness=0, L=1)
@@ -247,6 +276,14 @@ def test_Tran():
     dP = Tran(**kwargs)
     assert_allclose(dP, dP_expect*10)
 
+    # Tran's correlation gives 4.3 times the gas-only pressure drop for pure gas
+    kwargs['L'] = 1
+    assert_allclose(Tran(**dict(kwargs, x=0)), 19.00276790390895)
+    assert_allclose(Tran(**dict(kwargs, x=1)), 4.3*4012.248776469056)
+    for x in [-1E-9, 1.0 + 1E-9]:
+        with pytest.raises(ValueError):
+            Tran(**dict(kwargs, x=x))
+
 
 def test_Chen_Friedel():
     dP = Chen_Friedel(m=.0005, x=0.9, rhol=950., rhog=1.4, mul=1E-3, mug=1E-5, sigma=0.02, D=0.003, roughness=0, L=1)
@@ -619,4 +656,175 @@ def test_Mandhane_Gregory_Aziz_regime():
     
     regime = Mandhane_Gregory_Aziz_regime(m=.005, x=0.95, rhol=915.12, rhog=2.67, mul=180E-6, mug=14E-6, sigma=0.065, D=0.01)
     assert regime == 'wave'
-    
\ No newline at end of file
+    
+
+def test_two_phase_many():
+    kwargs = dict(m=0.6, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6, D=0.05, roughness=0, L=1)
+    xs = [1E-4, 0.1, 0.5, 0.9, 0.9999]
+    ms = [1E-3, 0.6, 5.0, 0.6, 0.6]
+    cases = [(Friedel_many, Friedel, {'sigma': 0.0487}),
+             (Chen_Friedel_many, Chen_Friedel, {'sigma': 0.0487}),
+             (Chen_Friedel_many, Chen_Friedel, {'sigma': 0.0487, 'D': 0.002}),
+             (Chisholm_many, Chisholm, {}),
+             (Chisholm_many, Chisholm, {'rough_correction': True, 'roughness': 1E-4}),
+             (Muller_Steinhagen_Heck_many, Muller_Steinhagen_Heck, {}),
+             (Tran_many, Tran, {'sigma': 0.0487})]
+    for f_many, f, extra in cases:
+        case = dict(kwargs, **extra)
+        case.pop('m')
+        dPs = f_many(m=ms, x=xs, **case)
+        assert dPs.shape == (5,)
+        assert_allclose(dPs, [f(m=m, x=x, **case) for m, x in zip(ms, xs)])
+
+    # Scalars broadcast against arrays; results written to `out`
+    out = np.zeros((2, 3))
+    D = np.array([[0.05], [0.1]])
+    dPs = Friedel_many(m=0.6, x=[0.1, 0.5, 0.9], rhol=915., rhog=2.67, mul=180E-6,
+                       mug=14E-6, sigma=0.0487, D=D, out=out)
+    assert dPs is out
+    assert_allclose(out[0, 0], 738.6500525002241)
+    assert_allclose(out[1, 2], Friedel(m=0.6, x=0.9, rhol=915., rhog=2.67, mul=180E-6,
+                                       mug=14E-6, sigma=0.0487, D=0.1))
+
+    # float32 arrays are calculated in float32
+    x32 = np.array(xs, dtype=np.float32)
+    for f_many, f in [(Friedel_many, Friedel), (Chen_Friedel_many, Chen_Friedel)]:
+        dPs = f_many(x=x32, sigma=0.0487, **kwargs)
+        assert dPs.dtype == np.float32
+        assert_allclose(dPs, [f(x=x, sigma=0.0487, **kwargs) for x in xs], rtol=1e-5)
+    assert Friedel_many(x=x32.astype(np.float64), sigma=0.0487, **kwargs).dtype == np.float64
+    # A list alongside a float32 array is not cast down to float32
+    dPs = Friedel_many(x=x32, sigma=0.0487, **dict(kwargs, m=[0.6]*5))
+    assert dPs.dtype == np.float64
+
+    # float16 would overflow, so it is calculated in float64
+    x16 = np.array([0.1, 0.5], dtype=np.float16)
+    dPs = Friedel_many(x=x16, sigma=0.0487, **kwargs)
+    assert dPs.dtype == np.float64
+    assert_allclose(dPs, [Friedel(x=float(x), sigma=0.0487, **kwargs) for x in x16])
+
+    # All-scalar inputs
+    assert_allclose(Friedel_many(**dict(kwargs, x=0.1, sigma=0.0487)), 738.6500525002241)
+    assert_allclose(Chen_Friedel_many(**dict(kwargs, x=0.1, sigma=0.0487)),
+                    Chen_Friedel(**dict(kwargs, x=0.1, sigma=0.0487)))
+
+def test_two_phase_many_numexpr(monkeypatch):
+    numexpr = pytest.importorskip('numexpr')
+    import fluids.two_phase
+    monkeypatch.setattr(fluids.two_phase, 'NUMEXPR_MIN_SIZE', 0)
+    threads = numexpr.set_num_threads(2)
+    try:
+        xs = np.linspace(0.0, 1.0, 11)
+        kwargs = dict(m=0.6, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6, sigma=0.0487, D=0.05)
+        assert_allclose(Friedel_many(x=xs, **kwargs), [Friedel(x=x, **kwargs) for x in xs])
+        assert_allclose(Chen_Friedel_many(x=xs[1:], **kwargs),
+                        [Chen_Friedel(x=x, **kwargs) for x in xs[1:]])
+    finally:
+        numexpr.set_num_threads(threads)
+
+
+def test_two_phase_array_x():
+    # An array quality is calculated by the array implementation
+    xs = np.array([0.0, 1E-4, 0.1, 0.5, 0.9, 0.9999, 1.0])
+    props = dict(m=0.6, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6, D=0.05, L=2.0)
+    cases = [(Friedel, dict(props, sigma=0.0487, roughness=1E-5)),
+             (Gronnerud, dict(props, roughness=1E-5)),
+             (Chisholm, dict(props, roughness=1E-5)),
+             (Chisholm, dict(props, roughness=1E-5, rough_correction=True)),
+             (Baroczy_Chisholm, dict(props, roughness=1E-5)),
+             (Chen_Friedel, dict(props, sigma=0.0487, roughness=1E-5)),
+             (Muller_Steinhagen_Heck, dict(props, roughness=1E-5)),
+             (Tran, dict(props, sigma=0.0487, roughness=1E-5)),
+             (Theissing, dict(props, roughness=1E-5)),
+             (Lombardi_Pedrocchi, dict(m=0.6, rhol=915., rhog=2.67, sigma=0.0487, D=0.05, L=2.0)),
+             (Zhang_Webb, dict(m=0.6, rhol=915., mul=180E-6, P=2E5, Pc=4055000, D=0.05, L=2.0))]
+    for f, kwargs in cases:
+        dPs = f(x=xs, **kwargs)
+        assert type(dPs) is np.ndarray
+        assert_allclose(dPs, [f(x=float(x), **kwargs) for x in xs], rtol=1E-12)
+
+    # Chen_Friedel's low Bond number regime is undefined at x = 0
+    kwargs = dict(m=.0005, rhol=950., rhog=1.4, mul=1E-3, mug=1E-5, sigma=0.02, D=0.003)
+    assert_allclose(Chen_Friedel(x=xs[1:], **kwargs),
+                    [Chen_Friedel(x=float(x), **kwargs) for x in xs[1:]], rtol=1E-12)
+
+
+def test_two_phase_make():
+    xs = [0.0, 1E-4, 0.1, 0.5, 0.9, 0.9999, 1.0]
+    kwargs = dict(m=0.6, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6, sigma=0.0487, D=0.05)
+    for case in [kwargs, dict(kwargs, m=5.0, rhog=30.0, roughness=1E-4, L=3.0),
+                 dict(kwargs, m=1E-3)]:
+        Friedel_x = make_Friedel(**case)
+        expect = [Friedel(x=x, **case) for x in xs]
+        assert_allclose([Friedel_x(x) for x in xs], expect)
+        assert_allclose(Friedel_x(np.array(xs)), expect)
+        with pytest.raises(ValueError):
+            Friedel_x(1.5)
+
+    # Both Bond number regimes; x = 0 is undefined in the low one
+    for D in [0.003, 0.05]:
+        case = dict(m=.0005, rhol=950., rhog=1.4, mul=1E-3, mug=1E-5, sigma=0.02, D=D)
+        Chen_Friedel_x = make_Chen_Friedel(**case)
+        expect = [Chen_Friedel(x=x, **case) for x in xs[1:]]
+        assert_allclose([Chen_Friedel_x(x) for x in xs[1:]], expect)
+        assert_allclose(Chen_Friedel_x(np.array(xs[1:])), expect)
+    assert_allclose(Chen_Friedel_x(0.0), Chen_Friedel(x=0.0, **case))
+
+    case = dict(m=0.6, rhol=915., mul=180E-6, P=2E5, Pc=4055000, D=0.05, roughness=1E-5)
+    Zhang_Webb_x = make_Zhang_Webb(**case)
+    expect = [Zhang_Webb(x=x, **case) for x in xs]
+    assert_allclose([Zhang_Webb_x(x) for x in xs], expect)
+    assert_allclose(Zhang_Webb_x(np.array(xs)), expect)
+
+
+try:
+    from fluids.optional import two_phase_cy
+    two_phase_cy_compiled = True
+except ImportError:
+    two_phase_cy_compiled = False
+
+@pytest.mark.skipif(not two_phase_cy_compiled,
+                    reason='two_phase_cy extension is not built')
+def test_two_phase_cy():
+    kwargs = dict(m=0.6, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6, D=0.05, roughness=0, L=1)
+    for case in [kwargs, dict(kwargs, m=5, rhog=30, roughness=1E-4), dict(kwargs, m=1E-3)]:
+        for x in [1E-4, 0.1, 0.5, 0.9, 0.9999]:
+            assert_allclose(two_phase_cy.Friedel(x=x, sigma=0.0487, **case),
+                            Friedel(x=x, sigma=0.0487, **case))
+            assert_allclose(two_phase_cy.Theissing(x=x, **case), Theissing(x=x, **case))
+            assert_allclose(two_phase_cy.Chen_Friedel(x=x, sigma=0.0487, **case),
+                            Chen_Friedel(x=x, sigma=0.0487, **case))
+            assert_allclose(two_phase_cy.Chen_Friedel(x=x, sigma=0.0487, **dict(case, D=0.002)),
+                            Chen_Friedel(x=x, sigma=0.0487, **dict(case, D=0.002)))
+            ZW_case = dict(case, P=1E6, Pc=4.6E6)
+            del ZW_case['rhog'], ZW_case['mug']
+            assert_allclose(two_phase_cy.Zhang_Webb(x=x, **ZW_case), Zhang_Webb(x=x, **ZW_case))
+
+    assert_allclose(two_phase_cy.Theissing(x=0, **kwargs), 19.00276790390895)
+    assert_allclose(two_phase_cy.Theissing(x=1, **kwargs), 4012.248776469056)
+    assert_allclose(two_phase_cy.Friedel(x=0, sigma=0.0487, **kwargs), 19.00276790390895)
+    assert_allclose(two_phase_cy.Friedel(x=1, sigma=0.0487, **kwargs), 4012.248776469056)
+    assert np.isnan(two_phase_cy.Friedel(x=1.5, sigma=0.0487, **kwargs))
+    dP = two_phase_cy.Friedel(m=0.6, x=0.1, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6, sigma=0.0487, D=0.05)
+    assert_allclose(dP, 738.6500525002241)
+
+
+@pytest.mark.skipif(not two_phase_cy_compiled,
+                    reason='two_phase_cy extension is not built')
+def test_two_phase_cy_Friedel_batch():
+    N = 1000
+    x = np.linspace(1E-4, 0.9999, N)
+    m = np.linspace(1E-3, 5.0, N)
+    rhog = np.linspace(2.67, 30.0, N)
+    ones = np.ones(N)
+    out = np.empty(N)
+    dPs = two_phase_cy.Friedel_batch(m, x, 915.*ones, rhog, 180E-6*ones, 14E-6*ones,
+                                     0.0487*ones, 0.05*ones, 1E-5*ones, ones, out)
+    assert_allclose(out, [Friedel(m=m[i], x=x[i], rhol=915., rhog=rhog[i], mul=180E-6,
+                                  mug=14E-6, sigma=0.0487, D=0.05, roughness=1E-5)
+                          for i in range(N)])
+    assert_allclose(np.asarray(dPs), out)
+
+    with pytest.raises(ValueError):
+        two_phase_cy.Friedel_batch(m, x, 915.*ones, rhog, 180E-6*ones, 14E-6*ones,
+                                   0.0487*ones, 0.05*ones, 1E-5*ones, ones, np.empty(N-1))
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, 2017 Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+from __future__ import division
+import fluids
+import fluids.two_phase_nb
+import numpy as np
+from numpy.testing import assert_allclose
+import pytest
+
+
+def test_two_phase_nb_matches_two_phase():
+    kwargs = dict(m=0.6, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6, D=0.05, roughness=0.0, L=1.0)
+    cases = [kwargs, dict(kwargs, m=5.0, rhog=30.0, roughness=1E-4),
+             dict(kwargs, m=1E-3), dict(kwargs, m=1.0, rhog=0.1)]
+    for name, extra in [('Friedel', dict(sigma=0.0487)), ('Tran', dict(sigma=0.0487)),
+                        ('Gronnerud', {}), ('Chisholm', {}), ('Baroczy_Chisholm', {}),
+                        ('Muller_Steinhagen_Heck', {}), ('Theissing', {}),
+                        ('Jung_Radermacher', {})]:
+        for case in cases:
+            case = dict(case, **extra)
+            for x in [1E-4, 0.1, 0.5, 0.9, 0.9999]:
+                dP = getattr(fluids.two_phase_nb, name)(x=x, **case)
+                assert_allclose(dP, getattr(fluids, name)(x=x, **case))
+
+    # Both branches of Chen's modification, Bo < 2.5 in the small pipe
+    for D in [0.05, 0.001]:
+        for x in [1E-4, 0.1, 0.5, 0.9, 0.9999]:
+            case = dict(kwargs, x=x, D=D, sigma=0.0487, m=0.01)
+            assert_allclose(fluids.two_phase_nb.Chen_Friedel(**case), fluids.Chen_Friedel(**case))
+            case = dict(m=0.6, x=x, rhol=915., mul=180E-6, P=2E5, Pc=4055000, D=D)
+            assert_allclose(fluids.two_phase_nb.Zhang_Webb(**case), fluids.Zhang_Webb(**case))
+
+    # Theissing endpoints
+    assert_allclose(fluids.two_phase_nb.Theissing(x=0.0, **kwargs), 19.00276790390895)
+    assert_allclose(fluids.two_phase_nb.Theissing(x=1.0, **kwargs), 4012.248776469056)
+
+    # Roughness correction
+    case = dict(kwargs, roughness=1E-4)
+    dP = fluids.two_phase_nb.Chisholm(x=0.1, rough_correction=True, **case)
+    assert_allclose(dP, 846.6778299960783)
+
+    dP = fluids.two_phase_nb.Lombardi_Pedrocchi(m=0.6, x=0.1, rhol=915., rhog=2.67, sigma=0.045, D=0.05, L=1.0)
+    assert_allclose(dP, 1567.328374498781)
+
+    # Default arguments
+    dP = fluids.two_phase_nb.Friedel(m=0.6, x=0.1, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6, sigma=0.0487, D=0.05)
+    assert_allclose(dP, 738.6500525002241)
+    dP = fluids.two_phase_nb.Friedel_nb(0.6, 0.1, 915., 2.67, 180E-6, 14E-6, 0.0487, 0.05, 0.0, 1.0)
+    assert_allclose(dP, 738.6500525002241)
+
+
+def test_two_phase_nb_quality_range():
+    # The single-phase pressure drops at the endpoints; NaN outside them
+    kwargs = dict(m=0.6, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6, D=0.05)
+    for f, extra in [(fluids.two_phase_nb.Friedel, dict(sigma=0.0487)),
+                     (fluids.two_phase_nb.Chisholm, {}),
+                     (fluids.two_phase_nb.Baroczy_Chisholm, {}),
+                     (fluids.two_phase_nb.Tran, dict(sigma=0.0487))]:
+        for x in [0.0, 1.0]:
+            assert_allclose(f(x=x, **dict(kwargs, **extra)),
+                            getattr(fluids, f.__name__)(x=x, **dict(kwargs, **extra)))
+        for x in [-1E-9, 1.0 + 1E-9]:
+            assert np.isnan(f(x=x, **dict(kwargs, **extra)))
+
+
+def test_Jung_Radermacher_nb_endpoints():
+    kwargs = dict(m=0.6, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6, D=0.05)
+    for x in [0.0, 1.0]:
+        with pytest.raises(ZeroDivisionError):
+            fluids.two_phase_nb.Jung_Radermacher(x=x, **kwargs)
+        with pytest.raises(ZeroDivisionError):
+            fluids.Jung_Radermacher(x=x, **kwargs)
+
+
+def test_friedel_along_pipe():
+    N = 50
+    x = np.linspace(0.01, 0.99, N)
+    rhog = np.linspace(2.67, 30., N)
+    ones = np.ones(N)
+    dL = np.full(N, 0.25)
+    out = np.empty(N)
+    dPs = fluids.two_phase_nb.friedel_along_pipe(0.6*ones, x, 915.*ones, rhog,
+                                                 180E-6*ones, 14E-6*ones, 0.0487*ones,
+                                                 0.05*ones, 1E-5*ones, dL, out)
+    assert dPs is out
+    expect = [fluids.Friedel(m=0.6, x=x[i], rhol=915., rhog=rhog[i], mul=180E-6,
+                             mug=14E-6, sigma=0.0487, D=0.05, roughness=1E-5, L=0.25)
+              for i in range(N)]
+    assert_allclose(dPs, expect)
+
+
+def test_two_phase_ufuncs():
+    with pytest.raises(AttributeError):
+        fluids.two_phase_nb.Friedel_ufunk
+    x = np.array([1E-4, 0.1, 0.5, 0.9, 0.9999])
+    D = np.array([[0.05], [0.002]])
+    out = np.empty((2, 5))
+    dPs = fluids.two_phase_nb.Friedel_ufunc(0.6, x, 915., 2.67, 180E-6, 14E-6, 0.0487, D,
+                                            1E-5, 1.0, out=out)
+    assert dPs is out
+    dPs_Chen = fluids.two_phase_nb.Chen_Friedel_ufunc(0.6, x, 915., 2.67, 180E-6, 14E-6,
+                                                      0.0487, D, 1E-5, 1.0)
+    dPs_ZW = fluids.two_phase_nb.Zhang_Webb_ufunc(0.6, x, 915., 180E-6, 1E6, 4.6E6, D,
+                                                  1E-5, 1.0)
+    assert dPs_Chen.shape == dPs_ZW.shape == (2, 5)
+    for i in range(2):
+        for j in range(5):
+            kwargs = dict(m=0.6, x=x[j], rhol=915., mul=180E-6, D=D[i, 0], roughness=1E-5)
+            assert_allclose(dPs[i, j], fluids.Friedel(rhog=2.67, mug=14E-6, sigma=0.0487, **kwargs))
+            assert_allclose(dPs_Chen[i, j], fluids.Chen_Friedel(rhog=2.67, mug=14E-6, sigma=0.0487,
+                                                                **kwargs))
+            assert_allclose(dPs_ZW[i, j], fluids.Zhang_Webb(P=1E6, Pc=4.6E6, **kwargs))
+
+    assert_allclose(fluids.two_phase_nb.Friedel_ufunc(0.6, 0.1, 915., 2.67, 180E-6, 14E-6,
+                                                      0.0487, 0.05, 0.0, 1.0), 738.6500525002241)
+
+    args32 = [np.float32(v) for v in (0.6, 915., 2.67, 180E-6, 14E-6, 0.0487, 0.05, 1E-5, 1.0)]
+    dPs32 = fluids.two_phase_nb.Friedel_ufunc(args32[0], x.astype(np.float32), *args32[1:])
+    assert dPs32.dtype == np.float32
+    assert_allclose(dPs32, dPs[0], rtol=1e-5)
+
+
+def test_make_Friedel_geometry():
+    f = fluids.two_phase_nb.make_Friedel_geometry(D=0.05, L=1.0, roughness=0.0, sigma=0.0487)
+    assert_allclose(f(0.6, 0.1, 915., 2.67, 180E-6, 14E-6), 738.6500525002241)
+    # Endpoints are the liquid-only and gas-only pressure drops
+    assert_allclose(f(0.6, 0.0, 915., 2.67, 180E-6, 14E-6), 19.00276790390895)
+    assert_allclose(f(0.6, 1.0, 915., 2.67, 180E-6, 14E-6), 4012.248776469056)
+
+    # One compiled function for the pipe; flow rate, quality and fluid vary
+    f = fluids.two_phase_nb.make_Friedel_geometry(D=0.1, L=3.0, roughness=1E-4)
+    for m in [1E-3, 0.6, 5.0]:
+        for rhol, rhog, mul, mug, sigma in [(915., 30., 180E-6, 14E-6, 0.0487),
+                                            (1000., 1.2, 1E-3, 1.8E-5, 0.072),
+                                            (600., 120., 9E-5, 1.5E-5, 0.01)]:
+            for x in [0.0, 1E-4, 0.1, 0.5, 0.9, 0.9999, 1.0]:
+                dP = f(m, x, rhol, rhog, mul, mug, sigma)
+                assert_allclose(dP, fluids.Friedel(m=m, x=x, rhol=rhol, rhog=rhog, mul=mul, mug=mug,
+                                                   sigma=sigma, D=0.1, roughness=1E-4, L=3.0))
+
+
+def test_make_Friedel():
+    f = fluids.two_phase_nb.make_Friedel(m=0.6, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6,
+                                         sigma=0.0487, D=0.05)
+    assert_allclose(f(0.1), 738.6500525002241)
+    # Endpoints are the liquid-only and gas-only pressure drops
+    assert_allclose(f(0.0), 19.00276790390895)
+    assert_allclose(f(1.0), 4012.248776469056)
+
+    for m in [1E-3, 0.6, 5.0]:
+        kwargs = dict(m=m, rhol=915., rhog=30., mul=180E-6, mug=14E-6, sigma=0.0487, D=0.1,
+                      roughness=1E-4, L=3.0)
+        f = fluids.two_phase_nb.make_Friedel(**kwargs)
+        for x in [0.0, 1E-4, 0.1, 0.5, 0.9, 0.9999, 1.0]:
+            assert_allclose(f(x), fluids.Friedel(x=x, **kwargs))
+
+    # Same results as the geometry-specialized factory
+    f_geometry = fluids.two_phase_nb.make_Friedel_geometry(D=0.1, L=3.0, roughness=1E-4, sigma=0.0487)
+    for x in [0.0, 0.1, 0.5, 0.9, 1.0]:
+        assert_allclose(f(x), f_geometry(5.0, x, 915., 30., 180E-6, 14E-6), rtol=1E-13)
+
+
+def test_make_Chen_Friedel_Zhang_Webb():
+    kwargs = dict(m=.0005, rhol=950., rhog=1.4, mul=1E-3, mug=1E-5, sigma=0.02, D=0.003)
+    f = fluids.two_phase_nb.make_Chen_Friedel(**kwargs)
+    for x in [1E-4, 0.1, 0.5, 0.9, 1.0]:
+        assert_allclose(f(x), fluids.Chen_Friedel(x=x, **kwargs))
+
+    kwargs = dict(m=0.6, rhol=915., mul=180E-6, P=2E5, Pc=4055000, D=0.05, roughness=1E-5)
+    f = fluids.two_phase_nb.make_Zhang_Webb(**kwargs)
+    for x in [0.0, 0.1, 0.5, 0.9, 1.0]:
+        assert_allclose(f(x), fluids.Zhang_Webb(x=x, **kwargs))
+
+
+def test_Friedel_gpu():
+    x = np.linspace(0.0, 1.0, 101)
+    m = np.linspace(1E-3, 5.0, 101)
+    expect = [fluids.Friedel(m=m[i], x=x[i], rhol=915., rhog=2.67, mul=180E-6, mug=14E-6,
+                             sigma=0.0487, D=0.05, roughness=1E-5) for i in range(101)]
+    # Runs on the CPU unless there are more points than `threshold`
+    thresholds = [1E9, 0] if fluids.two_phase_nb.IS_CUDA else [1E9]
+    for threshold in thresholds:
+        dPs = fluids.two_phase_nb.Friedel_gpu(m, x, 915., 2.67, 180E-6, 14E-6, 0.0487, 0.05,
+                                              roughness=1E-5, threshold=threshold)
+        assert_allclose(dPs, expect)
+
+    dPs = fluids.two_phase_nb.Friedel_gpu(m=0.6, x=[[0.1], [0.5]], rhol=915., rhog=2.67,
+                                          mul=180E-6, mug=14E-6, sigma=0.0487, D=[0.05, 0.1])
+    assert dPs.shape == (2, 2)
+    assert_allclose(dPs[0, 0], 738.6500525002241)
@@ -45,3 +45,70 @@ def test_Morsi_Alexander():
     assert_allclose(Cds, Cds_vect)
 
     
+
+
+def test_two_phase_correlations_array():
+    xs = [0.0, 1E-4, 0.1, 0.5, 0.9, 0.9999, 1.0]
+    kwargs = dict(m=0.6, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6, D=0.05, roughness=0, L=1)
+    for name, extra in [('Friedel', dict(sigma=0.0487)), ('Tran', dict(sigma=0.0487)),
+                        ('Chen_Friedel', dict(sigma=0.0487)), ('Gronnerud', {}), ('Chisholm', {}), ('Baroczy_Chisholm', {}),
+                        ('Muller_Steinhagen_Heck', {}), ('Theissing', {})]:
+        for case in [kwargs, dict(kwargs, m=5, rhog=30, roughness=1E-4), dict(kwargs, m=1E-3)]:
+            case = dict(case, **extra)
+            dPs = [getattr(fluids, name)(x=x, **case) for x in xs[1:-1]]
+            dPs_vect = getattr(fluids.vectorized, name)(x=xs[1:-1], **case)
+            assert_allclose(dPs, dPs_vect)
+
+    # Endpoints are special-cased in Theissing
+    dPs = [Theissing(x=x, **kwargs) for x in xs]
+    assert_allclose(fluids.vectorized.Theissing(x=xs, **kwargs), dPs)
+
+    dPs = [Jung_Radermacher(x=x, **kwargs) for x in xs[1:-1]]
+    assert_allclose(fluids.vectorized.Jung_Radermacher(x=xs[1:-1], **kwargs), dPs)
+
+    case = dict(kwargs, roughness=1E-4, rough_correction=True)
+    dPs = [Chisholm(x=x, **case) for x in xs[1:-1]]
+    assert_allclose(fluids.vectorized.Chisholm(x=xs[1:-1], **case), dPs)
+
+    # An array of rough_correction values falls back to numpy's vectorize
+    flags = [True, False, True]
+    dPs = [Chisholm(x=x, **dict(case, rough_correction=flag)) for x, flag in zip(xs[1:4], flags)]
+    assert_allclose(fluids.vectorized.Chisholm(x=xs[1:4], **dict(case, rough_correction=flags)), dPs)
+
+    dPs = [Lombardi_Pedrocchi(m=0.6, x=x, rhol=915., rhog=2.67, sigma=0.045, D=0.05, L=1) for x in xs[1:]]
+    dPs_vect = fluids.vectorized.Lombardi_Pedrocchi(m=0.6, x=xs[1:], rhol=915., rhog=2.67, sigma=0.045, D=0.05, L=1)
+    assert_allclose(dPs, dPs_vect)
+
+    # Both branches of the Chen modification; Bo < 2.5 for the small pipes
+    Ds = np.array([0.05, 0.001, 0.002, 0.1])
+    dPs = [Chen_Friedel(m=0.01, x=0.3, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6, sigma=0.0487, D=D) for D in Ds]
+    dPs_vect = fluids.vectorized.Chen_Friedel(m=0.01, x=0.3, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6, sigma=0.0487, D=Ds)
+    assert_allclose(dPs, dPs_vect)
+
+    dPs = [Zhang_Webb(m=0.6, x=x, rhol=915., mul=180E-6, P=2E5, Pc=4055000, D=0.05) for x in xs]
+    dPs_vect = fluids.vectorized.Zhang_Webb(m=0.6, x=xs, rhol=915., mul=180E-6, P=2E5, Pc=4055000, D=0.05)
+    assert_allclose(dPs, dPs_vect)
+
+    # Other arguments broadcast as well
+    dPs = [Friedel(m=m, x=0.1, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6, sigma=0.0487, D=0.05) for m in [0.6, 0.7]]
+    dPs_vect = fluids.vectorized.Friedel(m=[0.6, 0.7], x=0.1, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6, sigma=0.0487, D=0.05)
+    assert_allclose(dPs, dPs_vect)
+
+
+def test_Chisholm_array_B_regions():
+    # Covers every branch of the B schedule at once
+    ms = np.linspace(0.01, 10, 50)
+    rhogs = np.array([0.1, 2.67, 30, 300])
+    for f in (Chisholm, Baroczy_Chisholm):
+        dPs = [[f(m=m, x=0.3, rhol=915., rhog=rhog, mul=180E-6, mug=14E-6, D=0.05) for m in ms] for rhog in rhogs]
+        dPs_vect = getattr(fluids.vectorized, f.__name__)(m=ms, x=0.3, rhol=915., rhog=rhogs[:, None], mul=180E-6, mug=14E-6, D=0.05)
+        assert_allclose(dPs, dPs_vect)
+
+
+def test_two_phase_many_not_vectorized():
+    import fluids.two_phase
+    assert fluids.vectorized.Friedel_many is fluids.two_phase.Friedel_many
+    assert not hasattr(fluids.vectorized, 'make_Friedel')
+    dPs = fluids.vectorized.Tran_many(m=0.6, x=[0.1, 0.5], rhol=915., rhog=2.67,
+                                      mul=180E-6, mug=14E-6, sigma=0.0487, D=0.05)
+    assert_allclose(dPs, [423.2563312951231, 5381.677172302637])